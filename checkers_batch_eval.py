@@ -0,0 +1,136 @@
+"""Checkers(Draughts) Batch Evaluation - scores stacks of boards at once with NumPy array operations."""
+try:
+    import numpy as np
+except ImportError as error:  # Only this module needs NumPy, the game itself does not
+    raise ImportError('checkers_batch_eval needs NumPy: install it with `pip install numpy`') from error
+from checkers_game import BitBoard
+
+# Cell codes of the int8 board stack: Black is positive, Red is negative
+EMPTY: int = 0
+BLACK_MAN: int = 1
+BLACK_KING: int = 2
+RED_MAN: int = -1
+RED_KING: int = -2
+DIAGONALS: list[tuple[int, int]] = [(1, -1), (1, 1), (-1, -1), (-1, 1)]
+
+def unpackBits(bits: int, N: int) -> np.ndarray:
+    """Turn a bitboard into an N x N boolean array (square r*N+c at [r, c])."""
+    raw = np.frombuffer(bits.to_bytes((N * N + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder='little')[:N * N].reshape(N, N).astype(bool)
+
+def encodeBoards(boards: list[BitBoard]) -> np.ndarray:
+    """
+    Stack positions into one int8 array.
+
+    Args:
+        boards (list[BitBoard]): Positions of the same board size.
+
+    Returns:
+        np.ndarray: Array of shape (len(boards), N, N) with the cell codes above.
+    """
+    N = boards[0].N
+    stack = np.zeros((len(boards), N, N), dtype=np.int8)
+    for i, board in enumerate(boards):
+        kings = unpackBits(board.kings, N)
+        stack[i] += unpackBits(board.black, N) * np.where(kings, BLACK_KING, BLACK_MAN).astype(np.int8)
+        stack[i] += unpackBits(board.red, N) * np.where(kings, RED_KING, RED_MAN).astype(np.int8)
+    return stack
+
+def encodeChildren(board: BitBoard, moves: list[tuple[int, ...]], mark: str) -> np.ndarray:
+    """Encode the position after each move, so all children of a node are scored in one call."""
+    children = []
+    for move in moves:
+        board.makeMove(move, mark)
+        children.append(board.copy())
+        board.unmakeMove()
+    return encodeBoards(children)
+
+def neighbour(cells: np.ndarray, dr: int, dc: int) -> np.ndarray:
+    """
+    Look one diagonal step away for every square of a boolean board stack.
+
+    Returns:
+        np.ndarray: result[:, r, c] = cells[:, r + dr, c + dc], False off the board.
+    """
+    N = cells.shape[1]
+    padded = np.pad(cells, ((0, 0), (2, 2), (2, 2)))
+    return padded[:, 2 + dr:2 + dr + N, 2 + dc:2 + dc + N]
+
+def count(cells: np.ndarray) -> np.ndarray:
+    """Count the True squares of every board in a stack."""
+    return cells.sum(axis=(1, 2), dtype=np.int64)
+
+def evaluateBoards(boards: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a stack of positions from Black's (AI) point of view.
+
+    Computes the same terms and weights as CheckersAI.evaluateBitBoard: material, back
+    row, advancement and king centralisation through the piece-square table, the endgame
+    bonus, connectivity, king mobility, capture exposure, mobility and capture threats.
+
+    Args:
+        boards (np.ndarray): int8 array of shape (batch, N, N) as built by encodeBoards.
+
+    Returns:
+        np.ndarray: int64 score of every position.
+    """
+    batch, N, _ = boards.shape
+    masks = BitBoard.getMasks(N)
+    pst = masks['pst']
+    # Piece-square table indexed by cell code + 2
+    table = np.array([pst['RK'], pst['R'], [0] * (N * N), pst['B'], pst['BK']], dtype=np.int64)
+    flat = boards.reshape(batch, N * N).astype(np.int64)
+    score = table[flat + 2, np.arange(N * N)].sum(axis=1)
+    black, red = boards > 0, boards < 0
+    kings = np.abs(boards) == 2
+    black_kings, red_kings = black & kings, red & kings
+    empty = (boards == 0) & unpackBits(masks['playable'], N)
+    # Endgame Logic
+    endgame = count(black | red) < 8
+    score += np.where(endgame, 20 * count(black) - 20 * count(red & ~kings) - 30 * count(red_kings), 0)
+    # Piece Connectivity
+    black_connected = np.zeros_like(black)
+    red_connected = np.zeros_like(red)
+    for dr, dc in DIAGONALS:
+        black_connected |= black & neighbour(black, dr, dc)
+        red_connected |= red & neighbour(red, dr, dc)
+    score += 500 * count(black_connected) - 500 * count(red_connected)
+    black_exposed = np.zeros_like(black)
+    red_exposed = np.zeros_like(red)
+    black_near_red = np.zeros_like(black)
+    red_near_black = np.zeros_like(red)
+    black_captures = np.zeros_like(black)
+    red_captures = np.zeros_like(red)
+    open_once = np.zeros_like(empty)
+    open_twice = np.zeros_like(empty)
+    mobility = np.zeros(batch, dtype=np.int64)
+    for dr, dc in DIAGONALS:
+        red_there = neighbour(red, dr, dc)
+        black_there = neighbour(black, dr, dc)
+        empty_there = neighbour(empty, dr, dc)
+        empty_behind = neighbour(empty, -dr, -dc)
+        empty_beyond = neighbour(empty_there, dr, dc)
+        # Men of Black move down the board, men of Red up; kings move both ways
+        black_movers, red_movers = (black, red_kings) if dr > 0 else (black_kings, red)
+        # Threat & Safety Awareness: capturable pieces and pieces next to an opponent
+        black_exposed |= black & red_there & empty_behind
+        red_exposed |= red & black_there & empty_behind
+        black_near_red |= black & red_there
+        red_near_black |= red & black_there
+        # King Mobility: count open squares around kings
+        open_twice |= open_once & empty_there
+        open_once |= empty_there
+        # Mobility / Capture Moves
+        mobility += count(black_movers & empty_there) - count(red_movers & empty_there)
+        black_captures |= black_movers & red_there & empty_beyond
+        red_captures |= red_movers & black_there & empty_beyond
+    score -= 40 * count(black_kings & ~open_twice)
+    score += 40 * count(red_kings & ~open_twice)
+    score -= 2000 * count(black_exposed & ~kings) + 5000 * count(black_exposed & kings)
+    score += 2000 * count(red_exposed & ~kings) + 5000 * count(red_exposed & kings)
+    score -= 1500 * count(black_near_red)
+    score += 1500 * count(red_near_black)
+    score += 20 * mobility
+    score += 1000 * count(black_captures)
+    score -= 1000 * count(red_captures)
+    return score
@@ -0,0 +1,197 @@
+"""Checkers(Draughts) Self-Play Benchmark - headless engine-vs-engine games for CheckersAI."""
+import argparse
+import json
+import random
+import sys
+import time
+from checkers_game import BitBoard, CheckersAI
+
+def flipBoard(board: BitBoard) -> BitBoard:
+    """
+    Rotate the board by 180 degrees and swap the colours.
+
+    CheckersAI always plays Black, so Red's moves are searched on the flipped board.
+    Square sq maps to N*N - 1 - sq, which keeps every piece on a dark square.
+    """
+    size = board.N * board.N
+    def reverse(bits: int) -> int:
+        return int(format(bits, f'0{size}b')[::-1], 2)
+    return BitBoard(board.N, reverse(board.red), reverse(board.black), reverse(board.kings))
+
+def parseOpening(line: str) -> list[str]:
+    """Split an opening line such as 'C3-D4 F6-E5' into its moves."""
+    return line.split()
+
+def moveName(board: BitBoard, move: tuple[int, ...]) -> str:
+    """Format a move path as 'C3-D4' or 'C3-E5-C7' for multi-jumps."""
+    return '-'.join(board.squareName(sq) for sq in move)
+
+def playOpening(board: BitBoard, opening: list[str]) -> str:
+    """
+    Play the moves of a fixed opening, Black first.
+
+    Returns:
+        str: The side to move after the opening.
+    """
+    mark = 'B'
+    for name in opening:
+        move = tuple(board.squareIndex(pos) for pos in name.split('-'))
+        if move not in board.generateMoves(mark):
+            raise ValueError(f'Illegal opening move {name} for {mark}')
+        board.makeMove(move, mark)
+        mark = 'R' if mark == 'B' else 'B'
+    return mark
+
+def randomOpening(board: BitBoard, plies: int, rng: random.Random) -> list[str]:
+    """Pick `plies` random legal moves from the starting position (seeded by rng)."""
+    opening = []
+    probe = board.copy()
+    mark = 'B'
+    for _ in range(plies):
+        moves = probe.generateMoves(mark)
+        if not moves:
+            break
+        move = rng.choice(moves)
+        opening.append(moveName(probe, move))
+        probe.makeMove(move, mark)
+        mark = 'R' if mark == 'B' else 'B'
+    return opening
+
+def playGame(engines: dict[str, CheckersAI], N: int, opening: list[str], max_plies: int,
+             time_limit: float | None, depth: int | None) -> dict:
+    """
+    Play one engine-vs-engine game without any console input or output.
+
+    Args:
+        engines (dict[str, CheckersAI]): The AI playing each side ('B' and 'R').
+        N (int): Size of the board.
+        opening (list[str]): Moves played before the engines take over.
+        max_plies (int): Game is scored as a draw after this many plies (or earlier by
+            threefold repetition or the no-progress rule).
+        time_limit (float | None): Seconds per move, None for adaptive fixed depth.
+        depth (int | None): Fixed search depth, overrides the time limit.
+
+    Returns:
+        dict: Result, opening and per-move statistics of the game.
+    """
+    board = BitBoard.fromGrid(engines['B'].setUpGrid())
+    mark = playOpening(board, opening)
+    def record():  # Each engine keeps the history as seen from its own (flipped) board
+        engines['B'].recordPosition(mark, board)
+        engines['R'].recordPosition('R' if mark == 'B' else 'B', flipBoard(board))
+    record()
+    moves = []
+    result = 'draw'
+    for ply in range(len(opening), max_plies):
+        legal = board.generateMoves(mark)
+        if not legal:  # Side to move has no pieces or is blocked: it loses
+            result = 'R' if mark == 'B' else 'B'
+            break
+        engine = engines[mark]
+        searched = board if mark == 'B' else flipBoard(board)
+        engine.grid = searched.toGrid()
+        start = time.perf_counter()
+        best = engine.getBestMove('B', time_limit=time_limit, depth=depth)
+        seconds = time.perf_counter() - start
+        move = tuple(searched.squareIndex(pos) for pos in best)
+        if mark == 'R':
+            move = tuple(N * N - 1 - sq for sq in move)
+        if move not in legal:
+            raise RuntimeError(f'Engine played illegal move {best} for {mark}')
+        moves.append({'ply': ply, 'side': mark, 'move': moveName(board, move),
+                      'nodes': engine.nodes, 'seconds': round(seconds, 6)})
+        board.makeMove(move, mark)
+        mark = 'R' if mark == 'B' else 'B'
+        record()
+        if engines['B'].isHistoryDraw():  # Threefold repetition or no progress
+            break
+    return {'opening': opening, 'result': result, 'plies': len(opening) + len(moves), 'moves': moves}
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a list of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil(n * pct / 100)
+    return ordered[int(rank) - 1]
+
+def summarize(games: list[dict]) -> dict:
+    """Aggregate results, node counts and move latencies over all games."""
+    moves = [move for game in games for move in game['moves']]
+    latencies = [move['seconds'] * 1000 for move in moves]
+    nodes = sum(move['nodes'] for move in moves)
+    seconds = sum(move['seconds'] for move in moves)
+    return {
+        'games': len(games),
+        'results': {side: sum(game['result'] == side for game in games) for side in ['B', 'R', 'draw']},
+        'moves': len(moves),
+        'nodes': nodes,
+        'seconds': round(seconds, 3),
+        'nodes_per_sec': round(nodes / seconds) if seconds else 0,
+        'latency_ms': {f'p{pct}': round(percentile(latencies, pct), 3) for pct in [50, 90, 99, 100]},
+    }
+
+def runBenchmark(games: int, N: int = 8, seed: int = 0, opening_plies: int = 4, openings: list[list[str]] | None = None,
+                 time_limit: float | None = 0.5, depth: int | None = None, max_plies: int = 200,
+                 tt_size_mb: float = 32, workers: int = 1) -> dict:
+    """
+    Play a series of self-play games and collect benchmark statistics.
+
+    Openings are taken in turn from `openings` if given, otherwise each game starts with
+    `opening_plies` random moves drawn from a generator seeded with `seed`.
+
+    Returns:
+        dict: Configuration, summary and per-game records (JSON serializable).
+    """
+    rng = random.Random(seed)
+    records = []
+    for game_index in range(games):
+        engines = {mark: CheckersAI(N, tt_size_mb, time_limit, workers) for mark in ['B', 'R']}
+        if openings:
+            opening = openings[game_index % len(openings)]
+        else:
+            opening = randomOpening(BitBoard.fromGrid(engines['B'].setUpGrid()), opening_plies, rng)
+        try:
+            records.append(playGame(engines, N, opening, max_plies, time_limit, depth))
+        finally:
+            for engine in engines.values():
+                engine.close()
+    config = {'games': games, 'N': N, 'seed': seed, 'opening_plies': opening_plies, 'fixed_openings': bool(openings),
+              'time_limit': time_limit, 'depth': depth, 'max_plies': max_plies, 'tt_size_mb': tt_size_mb,
+              'workers': workers}
+    return {'config': config, 'summary': summarize(records), 'games': records}
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Headless CheckersAI self-play benchmark.')
+    parser.add_argument('--games', type=int, default=10, help='number of games to play')
+    parser.add_argument('--size', type=int, default=8, help='board size N')
+    parser.add_argument('--seed', type=int, default=0, help='seed for random openings')
+    parser.add_argument('--opening-plies', type=int, default=4, help='random moves before the engines play')
+    parser.add_argument('--openings', help="file with one fixed opening per line, e.g. 'C3-D4 F6-E5'")
+    parser.add_argument('--time-limit', type=float, default=0.5, help='seconds per move')
+    parser.add_argument('--depth', type=int, help='fixed search depth (overrides --time-limit)')
+    parser.add_argument('--max-plies', type=int, default=200, help='plies before a game is drawn')
+    parser.add_argument('--tt-size-mb', type=float, default=32, help='transposition table size per engine')
+    parser.add_argument('--workers', type=int, default=1, help='processes per engine for root search')
+    parser.add_argument('--output', help='write JSON here instead of standard output')
+    args = parser.parse_args(argv)
+    openings = None
+    if args.openings:
+        with open(args.openings) as file:
+            openings = [parseOpening(line) for line in file if line.strip()]
+    report = runBenchmark(args.games, args.size, args.seed, args.opening_plies, openings, args.time_limit,
+                          args.depth, args.max_plies, args.tt_size_mb, args.workers)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        summary = report['summary']
+        print(f"{summary['games']} games, results {summary['results']}, "
+              f"{summary['nodes_per_sec']} nodes/sec, p50 {summary['latency_ms']['p50']} ms")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+## Main Program
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+"""Checkers(Draughts) Opening Book Builder - deep searches of the early positions for CheckersAI."""
+import argparse
+import time
+from checkers_game import BOOK_PATH, CheckersAI, OpeningBook
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Build the opening book consulted by CheckersAI.')
+    parser.add_argument('--size', type=int, default=8, help='board size N')
+    parser.add_argument('--plies', type=int, default=10, help='plies from the start covered by the book')
+    parser.add_argument('--depth', type=int, default=8, help='search depth of every book move')
+    parser.add_argument('--tt-size-mb', type=float, default=64, help='transposition table size')
+    parser.add_argument('--output', default=BOOK_PATH, help='file to write')
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    def progress(message):
+        print(f'{message} ({time.perf_counter() - start:.1f}s)')
+    ai = CheckersAI(args.size, args.tt_size_mb, time_limit=None, book_path=None)
+    book = OpeningBook.generate(ai, args.plies, args.depth, progress=progress)
+    book.save(args.output)
+    print(f'Wrote {len(book)} positions to {args.output}')
+
+## Main Program
+if __name__ == '__main__':
+    main()
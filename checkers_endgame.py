@@ -0,0 +1,22 @@
+"""Checkers(Draughts) Endgame Database Builder - solves small endgames for CheckersAI."""
+import argparse
+import time
+from checkers_game import ENDGAME_PATH, EndgameDatabase
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Build the endgame database probed by CheckersAI.')
+    parser.add_argument('--size', type=int, default=8, help='board size N')
+    parser.add_argument('--pieces', type=int, default=3, help='largest number of pieces on the board')
+    parser.add_argument('--output', default=ENDGAME_PATH, help='file to write')
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    def progress(message):
+        print(f'{message} ({time.perf_counter() - start:.1f}s)')
+    database = EndgameDatabase.generate(args.size, args.pieces, progress)
+    database.save(args.output)
+    print(f'Wrote {len(database.data)} bytes to {args.output}')
+
+## Main Program
+if __name__ == '__main__':
+    main()
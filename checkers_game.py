@@ -1,7 +1,23 @@
 """Checkers(Draughts) Game - Coded and Documented - Husnain Maroof ML Engineer - 12 Sep, 2025.""" 
+import array
+import math
+import mmap
+import multiprocessing
 import os
 import platform
+import random
+import struct
 import time
+from concurrent.futures import ProcessPoolExecutor
+
+WIN_SCORE: int = 10_000_000  # Larger than any static evaluation
+MAX_SEARCH_DEPTH: int = 64     # Upper limit for iterative deepening
+NO_PROGRESS_PLIES: int = 80    # 40 moves each without a capture or a man moving is a draw
+ENDGAME_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'checkers_endgame.db')
+BOOK_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'checkers_book.bin')
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget of a move is used up."""
 class Checkers:
     """A class representing the game of Checkers with rules and mechanics."""
     players: list[tuple[str, str]] = [('Human', 'R'), ('Computer', 'B')]
@@ -16,6 +32,11 @@ class Checkers:
         self.N = N
         self.grid = self.setUpGrid()
         self.turn = 0
+        self.undo_stack: list[tuple[int, int, int, int, str, str]] = []  # Moves played with makeMove
+        # Draw rules: positions since the last capture or man move, and how many plies that was
+        self.position_history: list[int] = []
+        self.quiet_plies = 0
+        self.progress_state: tuple[int, int] | None = None
         
     def clear_screen(self):
         """
@@ -179,6 +200,42 @@ class Checkers:
             return False                 
         return False   
     
+    def makeMove(self, user_mark: str, start_pos: str, end_pos: str) -> str | bool:
+        """
+        Validate and play a move on self.grid in place, remembering how to undo it.
+
+        The moved piece and the jumped piece (if any) are pushed on the undo stack,
+        so promotion and captures can be reverted by unmakeMove without copying the grid.
+
+        Args:
+            user_mark (str): The player's piece ('R' or 'B').
+            start_pos (str): The starting position (e.g., "A3").
+            end_pos (str): The ending position (e.g., "B4").
+
+        Returns:
+            str | bool: Same result as validMove; False leaves the board untouched.
+        """
+        try:
+            row_1, col_1 = int(start_pos[1:]) - 1, ord(start_pos[0]) - ord('A')
+            row_2, col_2 = int(end_pos[1:]) - 1, ord(end_pos[0]) - ord('A')
+            piece = self.grid[row_1][col_1]
+            jumped = self.grid[(row_1 + row_2) // 2][(col_1 + col_2) // 2]
+        except (ValueError, IndexError):
+            return False
+        move = self.validMove(user_mark, start_pos, end_pos)
+        if move:
+            self.undo_stack.append((row_1, col_1, row_2, col_2, piece, jumped if move != 'simple' and
+                                    abs(row_2 - row_1) == 2 else ''))
+        return move
+
+    def unmakeMove(self) -> None:
+        """Take back the last move played with makeMove, restoring captured pieces and promotion."""
+        row_1, col_1, row_2, col_2, piece, jumped = self.undo_stack.pop()
+        self.grid[row_1][col_1] = piece
+        self.grid[row_2][col_2] = '-'
+        if jumped:
+            self.grid[(row_1 + row_2) // 2][(col_1 + col_2) // 2] = jumped
+
     def canCapturePieces(self, current_pos: str, user_mark: str, grid = None) -> bool:
         """
         Check if a given piece can capture any opponent piece.
@@ -197,7 +254,7 @@ class Checkers:
             col = ord(current_pos[0]) - ord('A')
         except (ValueError, IndexError):
             return False
-        piece = self.grid[row][col]
+        piece = grid[row][col]
         isKing = piece.endswith('K')
         directions = [(-2, -2), (-2, 2), (2, -2), (2, 2)] if isKing else \
                      [(-2, -2), (-2, 2)] if user_mark == 'R' else [(2, -2), (2, 2)]
@@ -206,8 +263,8 @@ class Checkers:
             next_row, next_col = row + dr, col + dc
             if 0 <= next_row < self.N and 0 <= next_col < self.N:
                 jumped_row, jumped_col = (row + next_row) // 2, (col + next_col) // 2 ## At center, there will be opponent
-                if self.grid[jumped_row][jumped_col] in [opponent_mark, f'{opponent_mark}K']\
-                    and self.grid[next_row][next_col] == '-':
+                if grid[jumped_row][jumped_col] in [opponent_mark, f'{opponent_mark}K']\
+                    and grid[next_row][next_col] == '-':
                     return True
         return False
     
@@ -261,6 +318,24 @@ class Checkers:
                         all_captures.append(pos)
         return all_captures  
        
+    def terminalStatus(self, user_mark: str, grid = None) -> tuple[int, int, bool]:
+        """
+        Compute what decides the end of the game for one player in a single routine.
+
+        Shared by the game loop and the search (see BitBoard.terminalStatus).
+
+        Args:
+            user_mark (str): The player's piece ('R' or 'B').
+            grid (list[list[str]], optional): Board to inspect, defaults to self.grid.
+
+        Returns:
+            tuple[int, int, bool]: The player's piece count, the opponent's piece count and
+            whether the player has any legal move.
+        """
+        if grid is None:
+            grid = self.grid
+        return BitBoard.fromGrid(grid, bare=True).terminalStatus(user_mark)
+
     def isWinner(self, user_mark: str, grid = None) -> bool: 
         """
         Check if the given player has won the game.
@@ -274,39 +349,59 @@ class Checkers:
         Returns:
             bool: True if the player has won, False otherwise.
         """
-        if grid is None:
-            grid = self.grid
         opponent_mark = 'B' if user_mark == 'R' else 'R'
-        if not any(cell in [opponent_mark, f'{opponent_mark}K'] for row in grid for cell in row):
-            return True
-        ## Check for any legal move
-        if not self.allAvailableCaptures(opponent_mark) and\
-            not self.allAvailableSimpleMoves(opponent_mark):
-                return True
-        return False    
+        _, _, has_move = self.terminalStatus(opponent_mark, grid)  # No pieces means no moves
+        return not has_move
     
+    def recordPosition(self, mark: str, board: 'BitBoard | None' = None) -> None:
+        """
+        Add the position with `mark` to move to the history used by the draw rules.
+
+        Captures and man moves cannot be undone, so they reset the no-progress count and
+        clear the history: no earlier position can occur again.
+
+        Args:
+            mark (str): The piece of the player to move ('R' or 'B').
+            board (BitBoard, optional): Position to record, defaults to self.grid.
+        """
+        if board is None:
+            board = BitBoard.fromGrid(self.grid)
+        progress = ((board.black | board.red) & ~board.kings, board.pieceCount())
+        if progress != self.progress_state:
+            self.progress_state = progress
+            self.position_history.clear()
+            self.quiet_plies = 0
+        else:
+            self.quiet_plies += 1
+        self.position_history.append(board.positionKey(mark))
+
+    def isHistoryDraw(self) -> bool:
+        """Return True if the last recorded position occurred three times or no progress was made for too long."""
+        if not self.position_history:
+            return False
+        return (self.position_history.count(self.position_history[-1]) >= 3 or
+                self.quiet_plies >= NO_PROGRESS_PLIES)
+
     def isDraw(self, grid = None) -> bool:
         """
         Check if the game is a draw.
 
-        A game is drawn if neither 'R' nor 'B' has won.
+        A game is drawn if neither 'R' nor 'B' has won and the board is blocked. Without
+        a grid argument the game history also counts: threefold repetition and
+        NO_PROGRESS_PLIES plies without a capture or a man moving are draws.
 
         Returns:
             bool: True if the game is a draw, False otherwise.
         """
-        # If either side has already won, it's not a draw
         if grid is None:
+            if self.isHistoryDraw():
+                return True
             grid = self.grid
-        if self.isWinner('R') or self.isWinner('B'):
+        # If either side has already won, it's not a draw
+        if not all(self.terminalStatus(mark, grid)[2] for mark in ['R', 'B']):
             return False
-        #Both players have no legal moves
-        if (not self.allAvailableCaptures('R') and not self.allAvailableSimpleMoves('R') and
-            not self.allAvailableCaptures('B') and not self.allAvailableSimpleMoves('B')):
-            return True
         # Board is filled with pieces, but no moves
-        if all(cell != '-' for row in grid for cell in row):
-            return True
-        return False 
+        return all(cell != '-' for row in grid for cell in row)
             
     def playGame(self) -> None:
         """
@@ -321,11 +416,15 @@ class Checkers:
         print('Only Diagonal Movement is allowed. Move should be like E6 -> D5.')
         print('-'*40)
         time.sleep(0.7)
+        self.recordPosition(self.players[self.turn % 2][1])
         while True:
             current_player, mark = self.players[self.turn % 2]
-            all_captures = self.allAvailableCaptures(mark)
             turn_finished = False
             if mark == 'R':  # Human Turn
+                # Complete capture sequences from the engine; every jump entered must follow one
+                board = BitBoard.fromGrid(self.grid, bare=True)
+                capture_paths = [tuple(board.squareName(sq) for sq in path) for path in board.captureMoves(mark)]
+                all_captures = sorted({path[0] for path in capture_paths})
                 if all_captures:
                     print(f"Capture(s) available. You must start from one of {','.join(all_captures)}")
                     start_pos = input(f'{current_player}({mark}), enter your starting point: ').strip().upper()
@@ -333,24 +432,21 @@ class Checkers:
                         print(f"You must choose from: {','.join(all_captures)}")
                         start_pos = input(f'{current_player}({mark}), enter your starting point: ').strip().upper()
 
-                    current_pos = start_pos
+                    played = (start_pos,)
                     # Multi-capture loop
                     while True:
-                        end_pos = input(f'{current_player}({mark}), enter your ending point from {current_pos}: ').strip().upper()
-                        temp_grid = [row.copy() for row in self.grid]
-                        move = self.validMove(mark, current_pos, end_pos, temp_grid)
-                        if move not in ['capture', f'{mark}K']:
+                        end_pos = input(f'{current_player}({mark}), enter your ending point from {played[-1]}: ').strip().upper()
+                        if not any(path[:len(played) + 1] == played + (end_pos,) for path in capture_paths):
                             print('Invalid capture move. Try again.')
                             continue
-                        # Commit the move
-                        move = self.validMove(mark, current_pos, end_pos)
+                        move = self.makeMove(mark, played[-1], end_pos)
                         self.clear_screen()
                         print(self)
                         if move == f'{mark}K':
                             print('You have become King!')
 
-                        current_pos = end_pos
-                        if self.canCapturePieces(current_pos, mark):
+                        played += (end_pos,)
+                        if played not in capture_paths:  # Only part of a capture sequence so far
                             print('You can capture again with the same piece.')
                             continue
                         else:
@@ -363,10 +459,8 @@ class Checkers:
                     while True:
                         start_pos = input(f'{current_player}({mark}), enter your starting point: ').strip().upper()
                         end_pos = input(f'{current_player}({mark}), enter your ending point: ').strip().upper()
-                        temp_grid = [row.copy() for row in self.grid]
-                        move = self.validMove(mark, start_pos, end_pos, temp_grid)
+                        move = self.makeMove(mark, start_pos, end_pos)
                         if move in ['simple', f'{mark}K']:
-                            self.validMove(mark, start_pos, end_pos)  # commit
                             if move == f'{mark}K':
                                 print('You have become King!')
                             self.clear_screen()    
@@ -375,11 +469,14 @@ class Checkers:
                             turn_finished = True
                             break
                         else:
+                            if move:
+                                self.unmakeMove()
                             print('Invalid Move! Try again.')
                  
             else:  # AI Turn 
                 self.aiMove(mark) 
                 turn_finished = True 
+            self.recordPosition('B' if mark == 'R' else 'R')
             if self.isWinner(mark):
                 print(f'{current_player}({mark}) won!')
                 print('='*50)
@@ -389,264 +486,994 @@ class Checkers:
                 print('Game is Draw!')
                 break 
             if turn_finished:
-                self.turn = (self.turn + 1) % 2  
-                     
-## AI Class            
-class CheckersAI(Checkers):
-    def __init__(self, N):
-        """
-    Initialize the Checkers AI with a board of size N x N.
+                self.turn = (self.turn + 1) % 2
 
-    Args:
-        N (int): Size of the board (usually 8 for standard Checkers).
+## Bitboard Board Representation
+class BitBoard:
     """
-        super().__init__(N)
-    def isSafeLanding(self, r: int, c: int, grid: list[list[str]], AI_mark: str) -> bool:
+    Bitboard representation of a Checkers position used by the AI search.
+
+    Every side is stored as one integer where bit ``r * N + c`` is set if that side
+    has a piece on row r, column c. A third integer marks which pieces are kings.
+    Black ('B') moves down the board (towards row N-1) and Red ('R') moves up,
+    exactly like the list based grid of the Checkers class.
+    """
+    __slots__ = ('N', 'black', 'red', 'kings', 'masks', 'key', 'score', 'connect', 'history')
+    _mask_cache: dict[int, dict] = {}
+
+    def __init__(self, N: int, black: int = 0, red: int = 0, kings: int = 0, key: int | None = None,
+                 score: int | None = None, connect: int | None = None) -> None:
         """
-        Check if a piece landing at (r,c) is safe:
-        1. No opponent can capture it immediately.
-        2. Adjacent diagonals are empty to avoid easy attacks or block.
+        Initialize a bitboard for an N x N board.
+
+        Args:
+            N (int): Size of the board.
+            black (int): Bitmask of Black pieces (men and kings).
+            red (int): Bitmask of Red pieces (men and kings).
+            kings (int): Bitmask of all kings of both sides.
+            key (int, optional): Zobrist key of the pieces, computed if not given.
+            score (int, optional): Piece-square evaluation terms, computed if not given.
+            connect (int, optional): Connectivity evaluation term, computed if not given.
         """
-        opponent_mark = 'R' if AI_mark == 'B' else 'B'
-        
-        # Step 1: Existing capture check
-        directions = [(-1,-1), (-1,1), (1,-1), (1,1)]
-        for dr, dc in directions:
-            opp_r, opp_c = r + dr, c + dc
-            land_r, land_c = r - dr, c - dc
-            if 0 <= opp_r < self.N and 0 <= opp_c < self.N and 0 <= land_r < self.N and 0 <= land_c < self.N:
-                if grid[opp_r][opp_c] in [opponent_mark, f'{opponent_mark}K'] and grid[land_r][land_c] == '-':
-                    return False  # immediate capture possible
-        
-        # Step 2: Check adjacency around landing
-        for dr, dc in directions:
-            adj_r, adj_c = r + dr, c + dc
-            if 0 <= adj_r < self.N and 0 <= adj_c < self.N:
-                if grid[adj_r][adj_c] in [opponent_mark, f'{opponent_mark}K']:
-                    return False  # adjacent opponent piece present
-        
-        return True
+        self.N = N
+        self.black = black
+        self.red = red
+        self.kings = kings
+        self.masks = BitBoard.getMasks(N)
+        self.key = self.computeKey() if key is None else key
+        self.score = self.computeScore() if score is None else score
+        self.connect = self.connectivityIn(self.masks['full']) if connect is None else connect
+        self.history: list[tuple[int, int, int, int, int, int]] = []  # Undo stack for makeMove
 
-        
-    def isStartOfCaptureChain(self, start_pos: str, user_mark: str, grid=None) -> bool:
-        """Return True if moving AI piece here allows opponent to start multi-capture."""
-        if grid is None:
-            grid = self.grid
-        r, c = int(start_pos[1:]) - 1, ord(start_pos[0]) - ord('A')
-        piece = grid[r][c]   # <- read actual piece, e.g. 'R' or 'RK'
-        isKing = piece.endswith('K')
+    @classmethod
+    def getMasks(cls, N: int) -> dict:
+        """
+        Build (once per board size) the shift amounts and edge masks used for move generation.
 
-        directions = [(-2, -2), (-2, 2), (2, -2), (2, 2)] if isKing else \
-                    [(-2, -2), (-2, 2)] if piece.startswith('R') else [(2, -2), (2, 2)]
+        Each direction (dr, dc) is shifted by ``dr * N + dc`` bits. The 'step' mask keeps only
+        the squares that can move one square in that direction without wrapping around a board
+        edge, the 'jump' mask does the same for two squares.
 
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < self.N and 0 <= nc < self.N:
-                jumped_r, jumped_c = (r + nr)//2, (c + nc)//2
-                if grid[jumped_r][jumped_c] in [user_mark, f'{user_mark}K'] and grid[nr][nc] == '-':
-                    landing_pos = self.letters[nc] + str(nr+1)
-                    temp_grid = [row.copy() for row in grid]
-                    temp_grid[nr][nc] = piece
-                    temp_grid[r][c] = '-'
-                    if self.canCapturePieces(landing_pos, user_mark, temp_grid):
-                        return True
-        return False
+        Args:
+            N (int): Size of the board.
 
-        
-    def evaluateBoard(self, grid=None) -> int:
-        """Enhanced evaluation for AI strength."""
-        if grid is None:
-            grid = self.grid  
-        opponent_mark = 'R'
-        ai_mark = 'B'
-        score = 0
-        N = self.N
-        #Endgame Logic
-        total_pieces = sum(1 for row in grid for cell in row if cell in ['B', 'BK', 'R', 'RK'])
-        is_endgame = total_pieces < 8  # A threshold to define the endgame
-        # Define center positions for control bonus
-        center_rows = [N//2 - 1, N//2, N//2 + 1, N//2 + 2] if N >= 8 else [N//2 - 1, N//2]
-        center_cols = [N//2 - 1, N//2, N//2 + 1, N//2 + 2] if N >= 8 else [N//2 - 1, N//2]
-        
-        
-        # Helper functions
-
-        def canBeCapturedBy(pos, opp_mark, grid): ## assume opp-mark = R
-            N = self.N 
-            r, c = pos
-            directions = [(-1,-1), (-1,1), (1,-1), (1,1)]# opponent piece adjacent
-            for dr, dc in directions:
-                opp_r, opp_c = r + dr, c + dc             # opponent piece location
-                land_r, land_c = r - dr, c - dc          # landing spot for capture
-                if 0 <= opp_r < N and 0 <= opp_c < N and 0 <= land_r < N and 0 <= land_c < N:
-                    if grid[opp_r][opp_c] in [opp_mark, f'{opp_mark}K'] and grid[land_r][land_c] == '-':
-                        return True
-            return False
+        Returns:
+            dict: Masks and direction tables for this board size.
+        """
+        if N in cls._mask_cache:
+            return cls._mask_cache[N]
+        full = (1 << (N * N)) - 1
+        def squaresWhere(condition) -> int:
+            bits = 0
+            for r in range(N):
+                for c in range(N):
+                    if condition(r, c):
+                        bits |= 1 << (r * N + c)
+            return bits
+        directions = {}
+        for dr, dc in [(1, -1), (1, 1), (-1, -1), (-1, 1)]:
+            step = squaresWhere(lambda r, c: 0 <= r + dr < N and 0 <= c + dc < N)
+            jump = squaresWhere(lambda r, c: 0 <= r + 2 * dr < N and 0 <= c + 2 * dc < N)
+            directions[(dr, dc)] = (dr * N + dc, step, jump)
+        masks = {
+            'full': full,
+            'playable': squaresWhere(lambda r, c: (r + c) % 2 == 1),
+            'top_row': squaresWhere(lambda r, c: r == 0),
+            'bottom_row': squaresWhere(lambda r, c: r == N - 1),
+            'center': squaresWhere(lambda r, c: r in BitBoard.centerLines(N) and c in BitBoard.centerLines(N)),
+            'all_dirs': list(directions.values()),
+            # Men of Black move down, men of Red move up; kings use all four directions
+            'B': [directions[(1, -1)], directions[(1, 1)]],
+            'R': [directions[(-1, -1)], directions[(-1, 1)]],
+        }
+        # Zobrist keys: one random 64-bit number per (square, piece type) and one for side to move.
+        # A fixed seed keeps hashes stable between runs so they can be stored in files.
+        rng = random.Random(1000 + N)
+        masks['zobrist'] = {piece: [rng.getrandbits(64) for _ in range(N * N)] for piece in ['B', 'BK', 'R', 'RK']}
+        masks['zobrist_side'] = rng.getrandbits(64)
+        # Piece-square table of the evaluation terms that only depend on a piece and its square
+        # (material, back row, advancement and king centralisation), from Black's point of view
+        center = BitBoard.centerLines(N)
+        masks['pst'] = {
+            'B': [50 + (30 if r == N - 1 else 0) + r * 5 for r in range(N) for c in range(N)],
+            'BK': [100 + (20 if r in center and c in center else 0) for r in range(N) for c in range(N)],
+            'R': [-5 - (30 if r == 0 else 0) - (N - r - 1) * 5 for r in range(N) for c in range(N)],
+            'RK': [-15 - (20 if r in center and c in center else 0) for r in range(N) for c in range(N)],
+        }
+        # Diagonal neighbours of every square, with and without the square itself
+        masks['neighbours'] = [squaresWhere(lambda r, c, sq=sq: abs(r - sq // N) == 1 and abs(c - sq % N) == 1)
+                               for sq in range(N * N)]
+        masks['around'] = [masks['neighbours'][sq] | 1 << sq for sq in range(N * N)]
+        # Jump table: (jumped square, landing square) pairs from every square, for men of
+        # each side and for kings, used to follow multi-jump capture chains
+        def jumpsFrom(sq, dirs):
+            r, c = divmod(sq, N)
+            return [((r + dr) * N + c + dc, (r + 2 * dr) * N + c + 2 * dc) for dr, dc in dirs
+                    if 0 <= r + 2 * dr < N and 0 <= c + 2 * dc < N]
+        masks['jumps'] = {
+            'B': [jumpsFrom(sq, [(1, -1), (1, 1)]) for sq in range(N * N)],
+            'R': [jumpsFrom(sq, [(-1, -1), (-1, 1)]) for sq in range(N * N)],
+            'K': [jumpsFrom(sq, [(1, -1), (1, 1), (-1, -1), (-1, 1)]) for sq in range(N * N)],
+        }
+        cls._mask_cache[N] = masks
+        return masks
 
-        def isConnected(r, c, mark, grid):
-            directions = [(-1,-1), (-1,1), (1,-1), (1,1)]
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < N and 0 <= nc < N:
-                    if grid[nr][nc].startswith(mark):
-                        return True
-            return False
+    @staticmethod
+    def centerLines(N: int) -> list[int]:
+        """Return the central rows (or columns) rewarded for king placement."""
+        return [N//2 - 1, N//2, N//2 + 1, N//2 + 2] if N >= 8 else [N//2 - 1, N//2]
+
+    @staticmethod
+    def shift(bits: int, amount: int, full: int) -> int:
+        """Shift a bitmask by a signed amount, dropping bits that fall off the board."""
+        return (bits << amount) & full if amount > 0 else bits >> -amount
+
+    @staticmethod
+    def iterBits(bits: int):
+        """Yield the index of every set bit, lowest first."""
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    @classmethod
+    def fromGrid(cls, grid: list[list[str]], bare: bool = False) -> 'BitBoard':
+        """
+        Build a bitboard from a Checkers grid.
+
+        Args:
+            grid (list[list[str]]): Board using 'R', 'RK', 'B', 'BK', '-' and '.'.
+            bare (bool): Leave the Zobrist key and evaluation terms at zero, for callers
+                that only look at the pieces and moves.
+
+        Returns:
+            BitBoard: The same position in bitboard form.
+        """
+        N = len(grid)
+        black = red = kings = 0
         for r in range(N):
             for c in range(N):
                 cell = grid[r][c]
-                # Step 1: Piece and King Value ---
-                if cell == ai_mark:
-                    score += 50
-                    if is_endgame:
-                        score += 20
-                elif cell == f'{ai_mark}K':
-                    score += 100
-                    if is_endgame:
-                        score += 20
-                elif cell == opponent_mark:
-                    score -= 5
-                    if is_endgame:
-                        score -= 20
-                elif cell == f'{opponent_mark}K':
-                    score -= 15
-                    if is_endgame:
-                        score -= 30
-       
-                #  Step 2: Back Row Safety ---
-                if r == N-1 and cell == ai_mark:
-                    score += 30
-                if r == 0 and cell == opponent_mark:
-                    score -= 30
-                #  Step 3: Promotion Potential ---
-                # B moves down, closer to bottom (N-1) → higher score
-                if cell == ai_mark:
-                    score += r * 5
-                # R moves up, closer to top (0) → higher score, so subtract less
-                elif cell == opponent_mark:
-                    score -= (N - r - 1) * 5
-                # Step 4 cont.: King Central Bonus ---
-                if r in center_rows and c in center_cols:
-                    if cell.endswith('K'):
-                        score += 20 if cell.startswith(ai_mark) else -20
-                # for King Safety
-                if cell == f'{ai_mark}K':
-                    directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-                    for dr, dc in directions:
-                        nr, nc = r + dr, c + dc
-                        if 0 <= nr < self.N and 0 <= nc < self.N and grid[nr][nc] == f'{opponent_mark}K':
-                            score -= 70  # Apply a high penalty for being adjacent to opponent's king
-                elif cell == f'{opponent_mark}K':
-                    directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-                    for dr, dc in directions:
-                        nr, nc = r + dr, c + dc
-                        if 0 <= nr < self.N and 0 <= nc < self.N and grid[nr][nc] == f'{ai_mark}K':
-                            score += 70 # Reward for being adjacent to opponent's king  
-                                  
-                #Check for King Mobility
-                if cell == f'{ai_mark}K':
-                    king_moves = 0
-                    directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-                    for dr, dc in directions:
-                        nr, nc = r + dr, c + dc
-                        if 0 <= nr < self.N and 0 <= nc < self.N and grid[nr][nc] == '-':
-                            king_moves += 1
-                    if king_moves < 2:  # Penalize if the king has fewer than 2 open squares
-                        score -= 40
-                elif cell == f'{opponent_mark}K':
-                    king_moves = 0
-                    directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-                    for dr, dc in directions:
-                        nr, nc = r + dr, c + dc
-                        if 0 <= nr < self.N and 0 <= nc < self.N and grid[nr][nc] == '-':
-                            king_moves += 1
-                    if king_moves < 2:
-                        score += 40        
-
-                # --- Step 7: Threat & Safety Awareness ---
-                # For AI pieces
-                if cell in [ai_mark, f'{ai_mark}K']:
-                    # 1. Penalize if AI piece can be captured
-                    if canBeCapturedBy((r, c), opponent_mark, grid):
-                        score -= 2000 if not cell.endswith('K') else 5000  # harsher for kings
-
-                    # 2. Penalize if AI moving here would land next to opponent (unsafe landing)
-                    if not self.isSafeLanding(r, c, grid, ai_mark):
-                        score -= 1500
-
-                    # 3. Penalize if AI move starts a capture chain for human
-                    current_pos = self.letters[c] + str(r + 1)
-                    if self.isStartOfCaptureChain(current_pos, opponent_mark, grid):
-                        score -= 15000  # heavy penalty
-
-                # For Human pieces
-                elif cell in [opponent_mark, f'{opponent_mark}K']:
-                    # 1. Reward AI if human piece can be captured safely
-                    if canBeCapturedBy((r, c), ai_mark, grid):
-                        score += 2000 if not cell.endswith('K') else 5000
-
-                    # 2. Penalize human landing on squares that are safe for AI to capture
-                    if not self.isSafeLanding(r, c, grid, opponent_mark):
-                        score += 1500
-
-                    # 3. Penalize human move if it starts a chain of captures that AI can exploit
-                    current_pos = self.letters[c] + str(r + 1)
-                    if self.isStartOfCaptureChain(current_pos, ai_mark, grid):
-                        score += 15000  # reward AI for forcing a bad human setup
-
-
-                    
-                #  Step 6: Piece Connectivity ---
-                if cell.startswith(ai_mark) and isConnected(r, c, ai_mark, grid):
-                    score += 500
-                if cell.startswith(opponent_mark) and isConnected(r, c, opponent_mark, grid):
-                    score -= 500
-        #  Step 7: Mobility / Capture Moves ---
-        ai_simple_moves = self.allAvailableSimpleMoves(ai_mark)
-        opponent_simple_moves = self.allAvailableSimpleMoves(opponent_mark)
-        ai_capture_moves = self.allAvailableCaptures(ai_mark)
-        opponent_capture_moves = self.allAvailableCaptures(opponent_mark)
-    
-        score += len(ai_simple_moves) * 20
-        score -= len(opponent_simple_moves) * 20
-        score += len(ai_capture_moves) * 1000
-        score -= len(opponent_capture_moves) * 1000
+                bit = 1 << (r * N + c)
+                if cell.startswith('B'):
+                    black |= bit
+                elif cell.startswith('R'):
+                    red |= bit
+                if cell.endswith('K'):
+                    kings |= bit
+        if bare:
+            return cls(N, black, red, kings, key=0, score=0, connect=0)
+        return cls(N, black, red, kings)
+
+    def toGrid(self) -> list[list[str]]:
+        """
+        Convert the bitboard back to a Checkers grid.
+
+        Returns:
+            list[list[str]]: A 2D list representing the board.
+        """
+        N = self.N
+        grid = [['-' if (i + j) % 2 == 1 else '.' for j in range(N)] for i in range(N)]
+        for mark, bits in (('B', self.black), ('R', self.red)):
+            for sq in BitBoard.iterBits(bits):
+                grid[sq // N][sq % N] = f'{mark}K' if self.kings >> sq & 1 else mark
+        return grid
+
+    def copy(self) -> 'BitBoard':
+        """Return an independent copy of this bitboard."""
+        return BitBoard(self.N, self.black, self.red, self.kings, self.key, self.score, self.connect)
+
+    def computeKey(self) -> int:
+        """
+        Compute the Zobrist key of the pieces from scratch.
+
+        Returns:
+            int: XOR of the random keys of every (square, piece type) on the board.
+        """
+        zobrist = self.masks['zobrist']
+        key = 0
+        for mark, bits in (('B', self.black), ('R', self.red)):
+            for sq in BitBoard.iterBits(bits):
+                key ^= zobrist[f'{mark}K' if self.kings >> sq & 1 else mark][sq]
+        return key
+
+    def pieceAt(self, sq: int) -> str:
+        """Return the piece symbol ('B', 'BK', 'R', 'RK') on an occupied square."""
+        mark = 'B' if self.black >> sq & 1 else 'R'
+        return f'{mark}K' if self.kings >> sq & 1 else mark
+
+    def computeScore(self) -> int:
+        """
+        Sum the piece-square table over all pieces from scratch.
+
+        Returns:
+            int: Material, back row, advancement and king center terms of the evaluation.
+        """
+        pst = self.masks['pst']
+        return sum(pst[self.pieceAt(sq)][sq] for sq in BitBoard.iterBits(self.black | self.red))
+
+    def connectivityIn(self, region: int) -> int:
+        """
+        Score the connectivity term for the pieces inside `region`.
+
+        A piece with a friendly piece on a diagonal neighbour is worth +500 for Black
+        and -500 for Red.
+
+        Args:
+            region (int): Bitmask of squares whose pieces are scored.
+
+        Returns:
+            int: Connectivity score of those pieces.
+        """
+        neighbours = self.masks['neighbours']
+        score = 0
+        for sq in BitBoard.iterBits(self.black & region):
+            if self.black & neighbours[sq]:
+                score += 500
+        for sq in BitBoard.iterBits(self.red & region):
+            if self.red & neighbours[sq]:
+                score -= 500
         return score
 
-    def availableValidMoves(self, player_mark: str, grid: list[list[str]]) -> list[tuple[str, str]]:
+    def positionKey(self, mark: str) -> int:
+        """Return the Zobrist hash of this position with `mark` to move."""
+        return self.key ^ self.masks['zobrist_side'] if mark == 'R' else self.key
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, BitBoard) and self.N == other.N and self.black == other.black
+                and self.red == other.red and self.kings == other.kings)
+
+    def __hash__(self) -> int:
+        return hash((self.N, self.black, self.red, self.kings))
+
+    def __repr__(self) -> str:
+        return f'BitBoard({self.N}, black={self.black:#x}, red={self.red:#x}, kings={self.kings:#x})'
+
+    def squareName(self, sq: int) -> str:
+        """Convert a square index to board notation such as 'E6'."""
+        return Checkers.letters[sq % self.N] + str(sq // self.N + 1)
+
+    def squareIndex(self, pos: str) -> int:
+        """Convert board notation such as 'E6' to a square index."""
+        return (int(pos[1:]) - 1) * self.N + ord(pos[0]) - ord('A')
+
+    def sides(self, mark: str) -> tuple[int, int]:
+        """Return (own pieces, opponent pieces) for the given player."""
+        return (self.black, self.red) if mark == 'B' else (self.red, self.black)
+
+    def empty(self) -> int:
+        """Return the bitmask of empty playable squares."""
+        return self.masks['playable'] & ~(self.black | self.red)
+
+    def pieceCount(self) -> int:
+        """Return the number of pieces left on the board."""
+        return (self.black | self.red).bit_count()
+
+    def moveDirections(self, mark: str, own: int) -> list[tuple[int, int, int, int]]:
+        """
+        Pair every direction with the pieces of `mark` allowed to move in it.
+
+        Returns:
+            list[tuple[int, int, int, int]]: (shift, movers, step mask, jump mask) per direction.
+        """
+        kings = own & self.kings
+        result = []
+        forward = self.masks[mark]
+        for direction in self.masks['all_dirs']:
+            movers = own if direction in forward else kings
+            if movers:
+                result.append((direction[0], movers, direction[1], direction[2]))
+        return result
+
+    def captureMoves(self, mark: str) -> list[tuple[int, ...]]:
+        """
+        Generate every complete capture sequence for a player.
+
+        The first jump of every sequence is found with shifts and masks, the rest of the
+        chain is followed through the jump table. A piece must keep jumping while it can,
+        and a man promoted during the chain continues as a king (like the human rules).
+
+        Args:
+            mark (str): The player's piece ('R' or 'B').
+
+        Returns:
+            list[tuple[int, ...]]: Moves as the path of squares visited, e.g. (from, via, to).
+        """
+        own, opp = self.sides(mark)
+        empty = self.empty()
+        full = self.masks['full']
+        promotion_row = self.masks['bottom_row' if mark == 'B' else 'top_row']
+        moves = []
+        for amount, movers, _, jump in self.moveDirections(mark, own):
+            over = BitBoard.shift(movers & jump, amount, full) & opp
+            landing = BitBoard.shift(over, amount, full) & empty
+            for to_sq in BitBoard.iterBits(landing):
+                from_sq = to_sq - 2 * amount
+                over_bit = 1 << (from_sq + amount)
+                is_king = bool(self.kings >> from_sq & 1 or promotion_row >> to_sq & 1)
+                self.extendCapture([from_sq, to_sq], 'K' if is_king else mark, promotion_row,
+                                   opp & ~over_bit, (empty | 1 << from_sq | over_bit) & ~(1 << to_sq), moves)
+        return moves
+
+    def extendCapture(self, path: list[int], piece: str, promotion_row: int, opp: int, empty: int,
+                      moves: list[tuple[int, ...]]) -> None:
+        """
+        Follow a capture chain depth-first and record every maximal sequence.
+
+        Args:
+            path (list[int]): Squares visited so far; the piece stands on the last one.
+            piece (str): 'K' for a king, otherwise the mark of the man ('R' or 'B').
+            promotion_row (int): Bitmask of the row where the man is crowned.
+            opp (int): Opponent pieces not yet captured in this chain.
+            empty (int): Empty squares, including the ones vacated during the chain.
+            moves (list[tuple[int, ...]]): Output list of finished sequences.
+        """
+        extended = False
+        for over_sq, land_sq in self.masks['jumps'][piece][path[-1]]:
+            if opp >> over_sq & 1 and empty >> land_sq & 1:
+                extended = True
+                over_bit, land_bit = 1 << over_sq, 1 << land_sq
+                path.append(land_sq)
+                self.extendCapture(path, 'K' if land_bit & promotion_row else piece, promotion_row,
+                                   opp & ~over_bit, (empty | over_bit | 1 << path[-2]) & ~land_bit, moves)
+                path.pop()
+        if not extended:
+            moves.append(tuple(path))
+
+    def simpleMoves(self, mark: str) -> list[tuple[int, int]]:
         """
-        Efficiently generate all valid moves (captures + simple moves) for a given player
-        on the provided grid by checking only legal directions.
+        Generate every non-capturing move for a player.
+
+        Args:
+            mark (str): The player's piece ('R' or 'B').
+
+        Returns:
+            list[tuple[int, int]]: Moves as (from square, to square).
+        """
+        own, _ = self.sides(mark)
+        empty = self.empty()
+        full = self.masks['full']
+        moves = []
+        for amount, movers, step, _ in self.moveDirections(mark, own):
+            targets = BitBoard.shift(movers & step, amount, full) & empty
+            for to_sq in BitBoard.iterBits(targets):
+                moves.append((to_sq - amount, to_sq))
+        return moves
+
+    def terminalStatus(self, mark: str) -> tuple[int, int, bool]:
+        """
+        Count both sides' pieces and check whether a player can move at all.
+
+        Stops at the first direction with a simple move or a jump, so no move list is built.
+
+        Args:
+            mark (str): The player's piece ('R' or 'B').
+
+        Returns:
+            tuple[int, int, bool]: The player's piece count, the opponent's piece count and
+            whether the player has any legal move.
+        """
+        own, opp = self.sides(mark)
+        empty = self.empty()
+        full = self.masks['full']
+        has_move = False
+        for amount, movers, step, jump in self.moveDirections(mark, own):
+            if BitBoard.shift(movers & step, amount, full) & empty or \
+                    BitBoard.shift(BitBoard.shift(movers & jump, amount, full) & opp, amount, full) & empty:
+                has_move = True
+                break
+        return own.bit_count(), opp.bit_count(), has_move
+
+    def generateMoves(self, mark: str) -> list[tuple[int, ...]]:
+        """Return all moves for a player: complete capture sequences first, then simple moves."""
+        return self.captureMoves(mark) + self.simpleMoves(mark)
+
+    def isCapture(self, move: tuple[int, ...]) -> bool:
+        """Return True if the move jumps over a piece."""
+        return abs(move[1] // self.N - move[0] // self.N) == 2
+
+    def play(self, move: tuple[int, ...], mark: str) -> 'BitBoard':
+        """
+        Return the position after `mark` plays `move` (this board is not modified).
+
+        Args:
+            move (tuple[int, ...]): Path of squares produced by the move generator.
+            mark (str): The player's piece ('R' or 'B').
+
+        Returns:
+            BitBoard: The new position, including captures and king promotion.
+        """
+        board = self.copy()
+        board.makeMove(move, mark)
+        return board
+
+    def makeMove(self, move: tuple[int, ...], mark: str) -> None:
+        """
+        Play `move` for `mark` on this board in place.
+
+        The previous state is pushed on the undo stack so unmakeMove can restore it.
+        The Zobrist key, piece-square score and connectivity term are updated from the
+        squares the move touches instead of being recomputed for the whole board.
+
+        Args:
+            move (tuple[int, ...]): Path of squares produced by the move generator; a simple
+                move is (from, to), a capture visits one landing square per jump.
+            mark (str): The player's piece ('R' or 'B').
+        """
+        self.history.append((self.black, self.red, self.kings, self.key, self.score, self.connect))
+        from_sq, to_sq = move[0], move[-1]
+        own, opp = self.sides(mark)
+        kings = self.kings
+        zobrist = self.masks['zobrist']
+        opponent_mark = 'R' if mark == 'B' else 'B'
+        pst = self.masks['pst']
+        around = self.masks['around']
+        from_bit, to_bit = 1 << from_sq, 1 << to_sq
+        promotion_row = self.masks['bottom_row' if mark == 'B' else 'top_row']
+        own = (own & ~from_bit) | to_bit
+        if kings & from_bit:
+            kings = (kings & ~from_bit) | to_bit
+            moved, landed = f'{mark}K', f'{mark}K'
+        elif any(promotion_row >> sq & 1 for sq in move[1:]):
+            kings |= to_bit  # King Promotion
+            moved, landed = mark, f'{mark}K'
+        else:
+            moved, landed = mark, mark
+        self.key ^= zobrist[moved][from_sq] ^ zobrist[landed][to_sq]
+        self.score += pst[landed][to_sq] - pst[moved][from_sq]
+        region = around[from_sq] | around[to_sq]  # Only pieces here can change connectivity
+        if self.isCapture(move):
+            for i in range(len(move) - 1):
+                over_sq = (move[i] + move[i + 1]) // 2
+                over_bit = 1 << over_sq
+                captured = f'{opponent_mark}K' if kings & over_bit else opponent_mark
+                self.key ^= zobrist[captured][over_sq]
+                self.score -= pst[captured][over_sq]
+                region |= around[over_sq]
+                opp &= ~over_bit
+                kings &= ~over_bit
+        connect_before = self.connectivityIn(region)
+        if mark == 'B':
+            self.black, self.red = own, opp
+        else:
+            self.red, self.black = own, opp
+        self.kings = kings
+        self.connect += self.connectivityIn(region) - connect_before
+
+    def unmakeMove(self) -> None:
+        """Take back the last move played with makeMove."""
+        self.black, self.red, self.kings, self.key, self.score, self.connect = self.history.pop()
+
+## Transposition Table
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results keyed by Zobrist hash.
+
+    Each slot keeps one entry (key, depth, flag, score, best move). The flag tells if the
+    score is EXACT, a LOWER bound (search failed high) or an UPPER bound (failed low).
+    On a collision the entry searched to the greater depth is kept (depth-preferred).
+    """
+    EXACT: int = 0
+    LOWER: int = 1
+    UPPER: int = 2
+    ENTRY_BYTES: int = 160  # Approximate size of one stored entry tuple in CPython
+
+    def __init__(self, size_mb: float = 32) -> None:
+        """
+        Allocate a table that stays within roughly `size_mb` megabytes.
+
+        Args:
+            size_mb (float): Memory cap for the table in megabytes.
+        """
+        entries = max(1, int(size_mb * 1024 * 1024) // self.ENTRY_BYTES)
+        self.size = 1 << (entries.bit_length() - 1)  # Round down to a power of two for masking
+        self.mask = self.size - 1
+        self.table: list[tuple | None] = [None] * self.size
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self.table if entry is not None)
+
+    def clear(self) -> None:
+        """Remove all stored entries."""
+        self.table = [None] * self.size
+
+    def probe(self, key: int) -> tuple | None:
+        """
+        Look up a position.
+
+        Args:
+            key (int): Zobrist hash of the position (including side to move).
+
+        Returns:
+            tuple | None: (key, depth, flag, score, best_move) or None if not stored.
+        """
+        entry = self.table[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, flag: int, score: float, best_move: tuple | None) -> None:
+        """
+        Store a search result, replacing the slot only if it is empty, holds the same
+        position, or was searched to a smaller depth.
+        """
+        index = key & self.mask
+        entry = self.table[index]
+        if entry is None or entry[0] == key or depth >= entry[1]:
+            self.table[index] = (key, depth, flag, score, best_move)
+
+## Endgame Database
+class EndgameDatabase:
+    """
+    Win/loss/draw tables with distance to the end for positions with few pieces.
+
+    Positions are grouped in slices by piece count. Inside a slice every position has a
+    fixed index built from the rank of its occupied dark squares (combinatorial number
+    system), the type of each piece and the side to move, so the file needs no keys: it
+    is a short header followed by one signed byte per position, and can be memory-mapped.
+
+    Stored byte for the side to move: 0 = draw, d > 0 = win in d plies,
+    -(d + 1) = loss in d plies (so a position without legal moves is -1).
+    The tables follow the engine's move rules (BitBoard.generateMoves).
+    """
+    MAGIC: bytes = b'CHKEGTB1'
+    HEADER_SIZE: int = len(MAGIC) + 2
+    MAX_DISTANCE: int = 126
+    PIECE_TYPES: list[str] = ['B', 'BK', 'R', 'RK']
+
+    def __init__(self, N: int, max_pieces: int, data) -> None:
+        """
+        Wrap the raw table bytes.
+
+        Args:
+            N (int): Size of the board.
+            max_pieces (int): Largest number of pieces covered by the tables.
+            data: Bytes-like object (bytes, bytearray or mmap) holding the whole file.
+        """
+        self.N = N
+        self.max_pieces = max_pieces
+        self.data = data
+        self.dark_squares = [sq for sq in range(N * N) if (sq // N + sq % N) % 2 == 1]
+        self.dark_index = {sq: i for i, sq in enumerate(self.dark_squares)}
+        self.offsets = {}
+        offset = self.HEADER_SIZE
+        for pieces in range(2, max_pieces + 1):
+            self.offsets[pieces] = offset
+            offset += self.sliceSize(pieces)
+
+    @staticmethod
+    def choose(n: int, k: int) -> int:
+        """Binomial coefficient that is 0 when k > n."""
+        return math.comb(n, k) if 0 <= k <= n else 0
+
+    def sliceSize(self, pieces: int) -> int:
+        """Number of positions (valid or not) in the slice with `pieces` pieces."""
+        return self.choose(len(self.dark_squares), pieces) * 4 ** pieces * 2
+
+    @classmethod
+    def load(cls, path: str) -> 'EndgameDatabase | None':
+        """
+        Memory-map a table file written by save.
+
+        Returns:
+            EndgameDatabase | None: The tables, or None if the file does not exist.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f'{path} is not a checkers endgame database')
+        N, max_pieces = data[len(cls.MAGIC)], data[len(cls.MAGIC) + 1]
+        return cls(N, max_pieces, data)
+
+    def save(self, path: str) -> None:
+        """Write the tables to a file."""
+        with open(path, 'wb') as file:
+            file.write(self.data)
+
+    def index(self, black: int, red: int, kings: int, mark: str) -> tuple[int, int]:
+        """
+        Compute the slice and index of a position.
+
+        Returns:
+            tuple[int, int]: (piece count, index inside that slice).
+        """
+        rank = types = 0
+        i = 0
+        for sq in BitBoard.iterBits(black | red):
+            i += 1
+            rank += self.choose(self.dark_index[sq], i)
+            types = types * 4 + (0 if black >> sq & 1 else 2) + (kings >> sq & 1)
+        return i, ((rank << (2 * i)) + types) * 2 + (mark == 'R')
+
+    def position(self, pieces: int, index: int) -> tuple[int, int, int, str] | None:
+        """
+        Decode an index of a slice back to a position.
+
+        Returns:
+            tuple[int, int, int, str] | None: (black, red, kings, side to move), or None if
+            the index describes an impossible position (a man on its promotion row or a
+            side without pieces).
         """
         N = self.N
-        letters = self.letters
-        capture_moves = []
-
-        opponent_mark = 'R' if player_mark == 'B' else 'B'
-
-        # Get positions that can capture
-        captures = self.allAvailableCaptures(player_mark, grid)
-        for start_pos in captures:
-            r = int(start_pos[1:]) - 1
-            c = ord(start_pos[0]) - ord('A')
-            piece = grid[r][c]
-            isKing = piece.endswith('K')
-            # Determine directions
-            directions = [(-2, -2), (-2, 2), (2, -2), (2, 2)] if isKing else \
-                        [(-2, -2), (-2, 2)] if player_mark == 'R' else [(2, -2), (2, 2)]
-
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < N and 0 <= nc < N:
-                    jumped_r, jumped_c = (r + nr) // 2, (c + nc) // 2
-                    if grid[jumped_r][jumped_c] in [opponent_mark, f'{opponent_mark}K'] and grid[nr][nc] == '-':
-                        end_pos = letters[nc] + str(nr + 1)
-                        capture_moves.append((start_pos, end_pos))
-
-        # Simple moves
-        simple_moves = self.allAvailableSimpleMoves(player_mark, grid)
-        return [*capture_moves, *simple_moves]
+        mark = 'R' if index & 1 else 'B'
+        rest = index >> 1
+        types = rest & ((1 << (2 * pieces)) - 1)
+        rank = rest >> (2 * pieces)
+        squares = []
+        for i in range(pieces, 0, -1):  # Unrank the combination, largest square first
+            d = i - 1
+            while self.choose(d + 1, i) <= rank:
+                d += 1
+            rank -= self.choose(d, i)
+            squares.append(self.dark_squares[d])
+        black = red = kings = 0
+        for sq in squares:  # Same order as index(): lowest square holds the most significant digit
+            piece = types & 3
+            types >>= 2
+            bit = 1 << sq
+            if piece == 0 and sq // N == N - 1 or piece == 2 and sq // N == 0:
+                return None  # Man on its own promotion row
+            if piece < 2:
+                black |= bit
+            else:
+                red |= bit
+            if piece & 1:
+                kings |= bit
+        if not black or not red:
+            return None
+        return black, red, kings, mark
+
+    def value(self, pieces: int, index: int) -> int:
+        """Return the stored signed byte of a position."""
+        byte = self.data[self.offsets[pieces] + index]
+        return byte - 256 if byte > 127 else byte
+
+    def probe(self, board: BitBoard, mark: str) -> int | None:
+        """
+        Look up a position with `mark` to move.
+
+        Returns:
+            int | None: Stored value (see class docstring), or None if the position is not
+            covered (too many pieces, a side without pieces or another board size).
+        """
+        if board.N != self.N or not board.black or not board.red:
+            return None
+        pieces = (board.black | board.red).bit_count()
+        if pieces > self.max_pieces:
+            return None
+        return self.value(*self.index(board.black, board.red, board.kings, mark))
+
+    @classmethod
+    def generate(cls, N: int = 8, max_pieces: int = 3, progress=None) -> 'EndgameDatabase':
+        """
+        Build the tables by retrograde analysis, smallest slices first.
+
+        Captures always lead into an already solved smaller slice. Inside a slice the
+        positions are solved backwards from the ones without legal moves: a position with a
+        move to a lost position is won, a position whose moves all reach won positions is
+        lost, and what is never solved is a draw. Memory stays a few bytes per position, but
+        time grows quickly with the piece count, so more than 3 pieces is an offline job.
+
+        Args:
+            N (int): Size of the board.
+            max_pieces (int): Largest piece count to solve.
+            progress (callable, optional): Called with a status string after each slice.
+
+        Returns:
+            EndgameDatabase: The generated tables (in memory, use save to write them).
+        """
+        header = cls.MAGIC + bytes([N, max_pieces])
+        db = cls(N, max_pieces, bytearray(header))
+        for pieces in range(2, max_pieces + 1):
+            db.data += db.solveSlice(pieces)
+            if progress:
+                progress(f'{pieces} pieces solved')
+        return db
+
+    def parents(self, black: int, red: int, kings: int, mark: str):
+        """
+        Yield the index of every position one simple move before this one.
+
+        The moves are taken back instead of stored: every piece of the side that moved last
+        steps back to an empty square it could have come from. A king on its promotion row
+        may also have been a man that was crowned by that move.
+
+        Args:
+            black (int): Bitmask of Black pieces.
+            red (int): Bitmask of Red pieces.
+            kings (int): Bitmask of all kings.
+            mark (str): The side to move in this position.
+        """
+        masks = BitBoard.getMasks(self.N)
+        full = masks['full']
+        mover = 'R' if mark == 'B' else 'B'
+        own = black if mover == 'B' else red
+        empty = masks['playable'] & ~(black | red)
+        promotion_row = masks['bottom_row' if mover == 'B' else 'top_row']
+        forward = masks[mover]
+        for direction in masks['all_dirs']:
+            amount, step, _ = direction
+            # Pieces that arrived with this step: the square behind them is empty and on the board
+            for to_sq in BitBoard.iterBits(own & BitBoard.shift(empty & step, amount, full)):
+                moved = 1 << to_sq | 1 << (to_sq - amount)
+                before = own ^ moved
+                pieces = (before, red) if mover == 'B' else (black, before)
+                if kings >> to_sq & 1:
+                    yield self.index(*pieces, kings ^ moved, mover)[1]
+                    if direction in forward and promotion_row >> to_sq & 1:  # Crowned by this move
+                        yield self.index(*pieces, kings & ~(1 << to_sq), mover)[1]
+                elif direction in forward:
+                    yield self.index(*pieces, kings, mover)[1]
+
+    def solveSlice(self, pieces: int) -> bytearray:
+        """
+        Solve every position with exactly `pieces` pieces (smaller slices must be solved).
+
+        Distances are settled in increasing order with one bucket of events per ply count:
+        a 'win' event solves a position as won at that distance, a 'done' event tells a
+        position that one more of its moves leads to a won position for the opponent, and a
+        'loss' event solves a position whose moves are all done. Counters are kept in byte
+        arrays indexed like the table, and the positions that lead to a solved one are found
+        by taking moves back (see parents), so memory stays a few bytes per position.
+
+        Returns:
+            bytearray: One signed byte per position of the slice.
+        """
+        DONE, WIN, LOSS = 0, 1, 2  # Event kinds, stored as index * 4 + kind
+        size = self.sliceSize(pieces)
+        values = bytearray(size)     # Non-zero once solved (a draw is never stored before the end)
+        remaining = bytearray(size)  # Moves not yet known to lose (a handful per position)
+        capture_loss = bytearray(size)  # Latest distance of a capture into a position won by the opponent
+        buckets: dict[int, array.array] = {}  # Distance -> events
+        def push(distance: int, index: int, kind: int) -> None:
+            buckets.setdefault(distance, array.array('q')).append(index * 4 + kind)
+        for index in range(size):
+            position = self.position(pieces, index)
+            if position is None:
+                continue
+            black, red, kings, mark = position
+            board = BitBoard(self.N, black, red, kings, key=0, score=0, connect=0)  # No evaluation needed
+            opponent_mark = 'R' if mark == 'B' else 'B'
+            moves = board.generateMoves(mark)
+            count = len(moves)
+            win = None
+            for move in moves:
+                if not board.isCapture(move):
+                    continue
+                # Leaves this slice, the result is already known
+                board.makeMove(move, mark)
+                stored = self.probe(board, opponent_mark)
+                board.unmakeMove()
+                if stored is None:     # Opponent has no pieces left
+                    stored = -1
+                if stored < 0:
+                    win = -stored if win is None else min(win, -stored)
+                elif stored > 0:
+                    count -= 1
+                    capture_loss[index] = max(capture_loss[index], stored + 1)
+            if win is not None:
+                push(win, index, WIN)
+            remaining[index] = count
+            if not count:  # Lost: no moves at all, or every capture reaches a won position
+                push(capture_loss[index], index, LOSS)
+        distance = 0
+        while buckets:
+            for event in buckets.pop(distance, []):
+                index, kind = event >> 2, event & 3
+                if values[index]:
+                    continue
+                if kind == DONE:
+                    remaining[index] -= 1
+                    if remaining[index]:
+                        continue
+                    if capture_loss[index] > distance:  # A capture loses more slowly
+                        push(capture_loss[index], index, LOSS)
+                        continue
+                capped = min(distance, self.MAX_DISTANCE)
+                values[index] = (capped if kind == WIN else -(capped + 1)) & 0xFF
+                for parent in self.parents(*self.position(pieces, index)):
+                    push(distance + 1, parent, DONE if kind == WIN else WIN)
+            distance += 1
+        return values
+
+## Opening Book
+class OpeningBook:
+    """
+    Precomputed best moves for early positions, keyed by the position's Zobrist hash.
+
+    The file is a short header followed by fixed-size records sorted by key: the 64-bit
+    key, the number of squares in the move path and up to MAX_PATH square indices.
+    """
+    MAGIC: bytes = b'CHKBOOK1'
+    MAX_PATH: int = 8
+    RECORD = struct.Struct(f'<QB{MAX_PATH}s')
+
+    def __init__(self, N: int, moves: dict[int, tuple[int, ...]] | None = None) -> None:
+        """
+        Create a book for an N x N board.
+
+        Args:
+            N (int): Size of the board.
+            moves (dict[int, tuple[int, ...]], optional): Best move path by position key.
+        """
+        self.N = N
+        self.moves = moves if moves is not None else {}
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    @classmethod
+    def load(cls, path: str) -> 'OpeningBook | None':
+        """
+        Read a book file written by save.
+
+        Returns:
+            OpeningBook | None: The book, or None if the file does not exist.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as file:
+            data = file.read()
+        if data[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f'{path} is not a checkers opening book')
+        book = cls(data[len(cls.MAGIC)])
+        for key, length, squares in cls.RECORD.iter_unpack(data[len(cls.MAGIC) + 1:]):
+            book.moves[key] = tuple(squares[:length])
+        return book
+
+    def save(self, path: str) -> None:
+        """Write the book to a file."""
+        with open(path, 'wb') as file:
+            file.write(self.MAGIC + bytes([self.N]))
+            for key in sorted(self.moves):
+                move = self.moves[key]
+                file.write(self.RECORD.pack(key, len(move), bytes(move)))
+
+    def lookup(self, board: BitBoard, mark: str) -> tuple[int, ...] | None:
+        """Return the book move for `mark` to move on the board, or None if not in the book."""
+        if board.N != self.N:
+            return None
+        return self.moves.get(board.positionKey(mark))
+
+    @classmethod
+    def generate(cls, ai: 'CheckersAI', plies: int = 10, depth: int = 8, AI_mark: str = 'B',
+                 progress=None) -> 'OpeningBook':
+        """
+        Build a book by searching every position the AI can face in the first plies.
+
+        Both starting sides are covered. At the AI's turns the move found by a deep search
+        is stored and played; at the opponent's turns every legal reply is followed.
+
+        Args:
+            ai (CheckersAI): AI used for the searches (its own book is not consulted).
+            plies (int): Number of plies from the start position covered by the book.
+            depth (int): Search depth of every book move.
+            AI_mark (str): The AI's piece ('B').
+            progress (callable, optional): Called with a status string after each search.
+
+        Returns:
+            OpeningBook: The generated book (in memory, use save to write it).
+        """
+        book = cls(ai.N)
+        opponent_mark = 'R' if AI_mark == 'B' else 'B'
+        visited = set()
+        saved_book, ai.book = ai.book, None
+        def expand(board: BitBoard, mark: str, ply: int) -> None:
+            key = board.positionKey(mark)
+            if ply >= plies or key in visited:
+                return
+            visited.add(key)
+            moves = board.generateMoves(mark)
+            if mark == opponent_mark:
+                for move in moves:
+                    expand(board.play(move, mark), AI_mark, ply + 1)
+                return
+            if not moves:
+                return
+            ai.grid = board.toGrid()
+            best = ai.getBestMove(AI_mark, depth=depth)
+            move = tuple(board.squareIndex(pos) for pos in best)
+            if len(move) <= cls.MAX_PATH:
+                book.moves[key] = move
+            if progress:
+                progress(f'{len(book)} positions, ply {ply}: {"-".join(best)}')
+            expand(board.play(move, mark), opponent_mark, ply + 1)
+        try:
+            start = BitBoard.fromGrid(ai.setUpGrid())
+            for mark in [AI_mark, opponent_mark]:
+                expand(start, mark, 0)
+        finally:
+            ai.book = saved_book
+        return book
+
+## AI Class
+class CheckersAI(Checkers):
+    def __init__(self, N, tt_size_mb: float = 32, time_limit: float | None = 2.0, workers: int = 1,
+                 quiescence_limit: int = 200, endgame_path: str | None = ENDGAME_PATH,
+                 book_path: str | None = BOOK_PATH):
+        """
+    Initialize the Checkers AI with a board of size N x N.
+
+    Args:
+        N (int): Size of the board (usually 8 for standard Checkers).
+        tt_size_mb (float): Memory cap of the transposition table in megabytes.
+        time_limit (float | None): Seconds the AI may think per move. None searches
+            to the fixed getAdaptiveDepth depth instead.
+        workers (int): Number of processes searching root moves in parallel (1 = serial).
+        quiescence_limit (int): Most nodes one quiescence search may visit at the horizon.
+        endgame_path (str | None): Endgame database file probed by the search; ignored if
+            the file does not exist or was built for another board size. None disables it.
+        book_path (str | None): Opening book file consulted before searching; ignored the
+            same way as endgame_path.
+    """
+        super().__init__(N)
+        # Kept across turns so positions searched last move are reused
+        self.tt = TranspositionTable(tt_size_mb)
+        self.tt_size_mb = tt_size_mb
+        self.time_limit = time_limit
+        self.deadline: float | None = None
+        self.nodes = 0
+        self.quiescence_limit = quiescence_limit
+        self.quiescence_nodes = 0
+        self.workers = workers
+        self.pool: ProcessPoolExecutor | None = None
+        self.shared_alpha = None
+        self.endgame_path = endgame_path
+        self.endgame = EndgameDatabase.load(endgame_path) if endgame_path else None
+        if self.endgame is not None and self.endgame.N != N:
+            self.endgame = None
+        self.book = OpeningBook.load(book_path) if book_path else None
+        if self.book is not None and self.book.N != N:
+            self.book = None
+        # Move ordering heuristics: two killer moves per ply, history score per (from, to)
+        self.killers: list[list[tuple[int, ...]]] = [[] for _ in range(MAX_SEARCH_DEPTH + 1)]
+        self.history_table = {mark: [[0] * (N * N) for _ in range(N * N)] for mark in ['R', 'B']}
+        # Positions on the current search path (plus the game history) and their quiet plies
+        self.search_path: dict[int, int] = {}
+        self.search_quiet = 0
+
+    def ageHeuristics(self) -> None:
+        """Forget killer moves and halve history scores before searching a new position."""
+        for killers in self.killers:
+            killers.clear()
+        for table in self.history_table.values():
+            for row in table:
+                for i, value in enumerate(row):
+                    if value:
+                        row[i] = value // 2
+
+    def pushSearchMove(self, board: BitBoard, move: tuple[int, ...], mark: str) -> int:
+        """
+        Play a move inside the search and put the position it leaves on the search path.
+
+        Returns:
+            int: The quiet ply count before the move, to be passed to popSearchMove.
+        """
+        key = board.positionKey(mark)
+        self.search_path[key] = self.search_path.get(key, 0) + 1
+        quiet = self.search_quiet
+        self.search_quiet = 0 if board.isCapture(move) or not board.kings >> move[0] & 1 else quiet + 1
+        board.makeMove(move, mark)
+        return quiet
+
+    def popSearchMove(self, board: BitBoard, mark: str, quiet: int) -> None:
+        """Take back a move played with pushSearchMove."""
+        board.unmakeMove()
+        key = board.positionKey(mark)
+        if self.search_path[key] == 1:
+            del self.search_path[key]
+        else:
+            self.search_path[key] -= 1
+        self.search_quiet = quiet
+
+    def close(self) -> None:
+        """Shut down the worker processes of the parallel search, if any were started."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
 
-    
     def getAdaptiveDepth(self) -> int:
         """
     Dynamically determine the AI's search depth based on remaining pieces.
@@ -656,136 +1483,502 @@ class CheckersAI(Checkers):
     """
         total_pieces = sum(row.count('R') + row.count('B') + row.count('RK') + row.count('BK') for row in self.grid)
         capture_moves = len(self.allAvailableCaptures('B')) + len(self.allAvailableCaptures('R'))
-        if capture_moves >= 3:
-            return 6
+        if capture_moves >= 3:       # Quiescence search resolves the captures at the horizon
+            return 7
         if total_pieces > 18:        # Early Opening
-            return 4 
+            return 6
         elif total_pieces > 12:      # Midgame
-            return 5
+            return 7
         elif total_pieces > 6:       # Late Midgame
-            return 6 
+            return 8
         else:
-            return 7
+            return 9
         
-    def simulateMove(self, move: tuple[str, str], mark: str, grid: list[list[str]]) -> list[list[str]] | None:
+    def evaluateBitBoard(self, board: BitBoard) -> int:
+        """
+        Evaluate a bitboard position from Black's (AI) point of view.
+
+        Material, back row, advancement, king centralisation and connectivity are kept up
+        to date by BitBoard.play, so only the endgame bonus and the tactical terms are
+        computed here, with a fixed number of mask operations per direction: capturable
+        pieces (2000, 5000 for kings), pieces next to an opponent (1500), kings with fewer
+        than two open squares (40), simple moves (20 each) and pieces that can capture
+        (1000 each).
+        """
+        masks = board.masks
+        full = masks['full']
+        black, red, kings = board.black, board.red, board.kings
+        empty = masks['playable'] & ~(black | red)
+        # Incrementally maintained terms
+        score = board.score + board.connect
+        if (black | red).bit_count() < 8:  # Endgame Logic
+            score += 20 * black.bit_count()
+            score -= 20 * (red & ~kings).bit_count() + 30 * (red & kings).bit_count()
+        black_kings, red_kings = black & kings, red & kings
+        black_exposed = red_exposed = black_near_red = red_near_black = 0
+        black_captures = red_captures = 0
+        open_once = open_twice = 0
+        mobility = 0
+        for amount, step, jump in masks['all_dirs']:
+            if amount > 0:  # Pointing down the board: forward for Black men
+                red_there = (red >> amount) & step
+                black_there = (black >> amount) & step
+                empty_there = (empty >> amount) & step
+                empty_behind = (empty << amount) & full & (step << amount)
+                black_movers, red_movers = black, red_kings
+            else:
+                red_there = (red << -amount) & full & step
+                black_there = (black << -amount) & full & step
+                empty_there = (empty << -amount) & full & step
+                empty_behind = (empty >> -amount) & (step >> -amount)
+                black_movers, red_movers = black_kings, red
+            # Threat & Safety Awareness: capturable pieces and pieces next to an opponent
+            black_exposed |= black & red_there & empty_behind
+            red_exposed |= red & black_there & empty_behind
+            black_near_red |= black & red_there
+            red_near_black |= red & black_there
+            # King Mobility: count open squares around kings
+            open_twice |= open_once & empty_there
+            open_once |= empty_there
+            # Mobility / Capture Moves
+            mobility += (black_movers & empty_there).bit_count() - (red_movers & empty_there).bit_count()
+            if amount > 0:
+                black_captures |= black_movers & jump & ((red & (empty >> amount)) >> amount)
+                red_captures |= red_movers & jump & ((black & (empty >> amount)) >> amount)
+            else:
+                black_captures |= black_movers & jump & (((red & (empty << -amount)) << -amount) & full)
+                red_captures |= red_movers & jump & (((black & (empty << -amount)) << -amount) & full)
+        # The grid evaluator also had a +-15000 capture-chain term. It is left out: it relied on
+        # canCapturePieces, which ignored the grid it was given (fixed later), so the term never
+        # scored the searched position. The mobility and capture counts below come from the grid
+        # evaluator too, where they were counted on the live board instead of the searched one.
+        score -= 40 * (black_kings & ~open_twice).bit_count()
+        score += 40 * (red_kings & ~open_twice).bit_count()
+        score -= 2000 * (black_exposed & ~kings).bit_count() + 5000 * (black_exposed & kings).bit_count()
+        score += 2000 * (red_exposed & ~kings).bit_count() + 5000 * (red_exposed & kings).bit_count()
+        score -= 1500 * black_near_red.bit_count()
+        score += 1500 * red_near_black.bit_count()
+        score += 20 * mobility
+        score += 1000 * black_captures.bit_count()
+        score -= 1000 * red_captures.bit_count()
+        return score
+
+    def evaluateMove(self, board: BitBoard, move: tuple[int, ...], mark: str, maximizingPlayer: bool = True) -> int:
         """
-        Simulate applying a move on a copy of the board.
+        Evaluate the position after a move without copying the board (for move ordering).
+
+        Returns:
+            int: The evaluation, negated when ordering for the minimizing player.
+        """
+        board.makeMove(move, mark)
+        score = self.evaluateBitBoard(board)
+        board.unmakeMove()
+        return score if maximizingPlayer else -score
+
+    def orderMoves(self, board: BitBoard, moves: list[tuple[int, ...]], mark: str,
+                   tt_move: tuple[int, ...] | None, ply: int) -> None:
+        """
+        Sort moves in place, most promising first, without evaluating any child position.
+
+        Order: captures (longest chains first), the transposition table move, the killer
+        moves of this ply, then simple moves by their history score.
+        """
+        killers = self.killers[ply] if ply < len(self.killers) else []
+        history = self.history_table[mark]
+        moves.sort(key=lambda move: (len(move) if board.isCapture(move) else 0, move == tt_move,
+                                     move in killers, history[move[0]][move[-1]]), reverse=True)
+
+    def recordCutoff(self, board: BitBoard, move: tuple[int, ...], mark: str, depth: int, ply: int) -> None:
+        """
+        Remember a quiet move that caused a beta cutoff (killer move and history heuristic).
+        """
+        if board.isCapture(move):
+            return  # Captures are already searched first
+        if ply < len(self.killers):
+            killers = self.killers[ply]
+            if move not in killers:
+                killers.insert(0, move)
+                del killers[2:]  # Keep two killer moves per ply
+        self.history_table[mark][move[0]][move[-1]] += depth * depth
+
+    def countNode(self) -> None:
+        """
+        Count a searched node and raise SearchTimeout once the deadline has passed.
+
+        Minimax and quiescence nodes share the counter, so the clock is read every 1024
+        nodes however the search time is split between them.
+        """
+        self.nodes += 1
+        if self.deadline is not None and self.nodes & 1023 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+
+    def quiescence(self, board: BitBoard, maximizingPlayer: bool, AI_mark: str, alpha: float, beta: float) -> int:
+        """
+        Search only capture sequences at the horizon so leaves are tactically quiet.
+
+        Captures are not compulsory for the AI, so the side to move may always stand pat
+        on the static evaluation instead of capturing. The search stops extending once
+        quiescence_limit nodes were visited since the horizon was reached.
 
         Args:
-            move (tuple[str, str]): The move as (start_pos, end_pos).
-            mark (str): The player's piece ('R' or 'B').
-            grid (list[list[str]]): The current board configuration.
+            board (BitBoard): Position at the horizon.
+            maximizingPlayer (bool): True if the AI is to move.
+            AI_mark (str): The AI's piece ('B').
+            alpha (float): Best score the maximizer can guarantee so far.
+            beta (float): Best score the minimizer can guarantee so far.
 
         Returns:
-            list[list[str]] | None: New grid after move, or None if invalid.
+            int: Score of the position from the AI's point of view.
         """
-        start_pos, end_pos = move
-        new_grid = [row.copy() for row in grid]
-        if self.validMove(mark, start_pos, end_pos, new_grid):
-            return new_grid
+        self.countNode()
+        self.quiescence_nodes += 1
+        opponent_mark = 'R' if AI_mark == 'B' else 'B'
+        player_mark = AI_mark if maximizingPlayer else opponent_mark
+        if not board.terminalStatus(player_mark)[2]:  # No pieces or no legal move left: lost
+            return -WIN_SCORE if maximizingPlayer else WIN_SCORE
+        stand_pat = self.evaluateBitBoard(board)
+        if self.quiescence_nodes > self.quiescence_limit:
+            return stand_pat
+        if maximizingPlayer:
+            if stand_pat >= beta:
+                return stand_pat
+            best_score = stand_pat
+            alpha = max(alpha, stand_pat)
+        else:
+            if stand_pat <= alpha:
+                return stand_pat
+            best_score = stand_pat
+            beta = min(beta, stand_pat)
+        captures = board.captureMoves(player_mark)
+        captures.sort(key=len, reverse=True)
+        for move in captures:
+            board.makeMove(move, player_mark)
+            eval_score = self.quiescence(board, not maximizingPlayer, AI_mark, alpha, beta)
+            board.unmakeMove()
+            if maximizingPlayer:
+                best_score = max(best_score, eval_score)
+                alpha = max(alpha, eval_score)
+            else:
+                best_score = min(best_score, eval_score)
+                beta = min(beta, eval_score)
+            if beta <= alpha:
+                break
+        return best_score
 
-    def minimax(self, grid: list[list[str]], depth: int, maximizingPlayer: bool, 
-            AI_mark: str, alpha: float, beta: float) -> int:
+    def minimax(self, board: BitBoard, depth: int, maximizingPlayer: bool,
+            AI_mark: str, alpha: float, beta: float, ply: int = 0) -> int:
         """
-        Perform minimax search with alpha-beta pruning and quiescence search.
+        Perform minimax search with alpha-beta pruning and quiescence search on a bitboard position.
+
+        Args:
+            board (BitBoard): Position to search.
+            depth (int): Remaining search depth in plies.
+            maximizingPlayer (bool): True if the AI is to move.
+            AI_mark (str): The AI's piece ('B').
+            alpha (float): Best score the maximizer can guarantee so far.
+            beta (float): Best score the minimizer can guarantee so far.
+            ply (int): Distance from the root, used for killer moves.
+
+        Returns:
+            int: Score of the position from the AI's point of view.
         """
-        # Safeguard: terminate recursion if depth reaches 0
-        if depth <= 0:
-            return self.evaluateBoard(grid)
-        # Check for game end conditions
-        if self.isWinner('R', grid) or self.isWinner('B', grid) or self.isDraw(grid):
-            return self.evaluateBoard(grid)
+        self.countNode()
         opponent_mark = 'R' if AI_mark == 'B' else 'B'
         player_mark = AI_mark if maximizingPlayer else opponent_mark
-        moves = self.availableValidMoves(player_mark, grid)
-
-    # Sort moves: prioritize captures, then evaluation
-        moves.sort(
-        key=lambda move: (
-            self.validMove(player_mark, move[0], move[1], [row.copy() for row in grid]) == 'capture',
-            self.evaluateBoard(self.simulateMove(move, player_mark, [row.copy() for row in grid]))
-        ),
-        reverse=maximizingPlayer
-    )
+        key = board.positionKey(player_mark)
+        # A position already on the path (or in the game) can be repeated forever: draw
+        if key in self.search_path or self.search_quiet >= NO_PROGRESS_PLIES:
+            return 0
+        if self.endgame is not None:
+            stored = self.endgame.probe(board, player_mark)
+            if stored is not None:
+                # Exact result: score wins like the search does, so faster wins stay better
+                if stored == 0:
+                    score = 0
+                elif stored > 0:
+                    score = WIN_SCORE + depth - stored
+                else:
+                    score = -(WIN_SCORE + depth + stored + 1)
+                return score if maximizingPlayer else -score
+        if depth <= 0:
+            self.quiescence_nodes = 0
+            return self.quiescence(board, maximizingPlayer, AI_mark, alpha, beta)
+        # Transposition table: reuse results of positions reached by other move orders
+        entry = self.tt.probe(key)
+        tt_move = None
+        if entry is not None:
+            _, entry_depth, flag, entry_score, tt_move = entry
+            if entry_depth >= depth:
+                if flag == TranspositionTable.EXACT:
+                    return entry_score
+                if flag == TranspositionTable.LOWER:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+        alpha_orig, beta_orig = alpha, beta
+        moves = board.generateMoves(player_mark)
+        # Side to move without pieces or legal moves has lost; prefer the quickest win
+        if not moves:
+            return -(WIN_SCORE + depth) if maximizingPlayer else WIN_SCORE + depth
+
+        self.orderMoves(board, moves, player_mark, tt_move, ply)
+        best_move = None
         if maximizingPlayer:
             maxEval = float('-inf')
             for move in moves:
-                new_grid = self.simulateMove(move, AI_mark, grid)
-                if new_grid is None:
-                    continue
-                # Always reduce depth to avoid infinite recursion
-                eval_score = self.minimax(new_grid, depth - 1, False, AI_mark, alpha, beta)
-
-                maxEval = max(maxEval, eval_score)
+                quiet = self.pushSearchMove(board, move, AI_mark)
+                eval_score = self.minimax(board, depth - 1, False, AI_mark, alpha, beta, ply + 1)
+                self.popSearchMove(board, AI_mark, quiet)
+                if eval_score > maxEval:
+                    maxEval, best_move = eval_score, move
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
+                    self.recordCutoff(board, move, player_mark, depth, ply)
                     break
-            return maxEval
+            best_score = maxEval
 
         else:  # Minimizing player
             minEval = float('inf')
-
             for move in moves:
-                new_grid = self.simulateMove(move, opponent_mark, grid)
-                if new_grid is None:
-                    continue
-                # Always reduce depth to avoid infinite recursion
-                eval_score = self.minimax(new_grid, depth - 1, True, AI_mark, alpha, beta)
-
-                minEval = min(minEval, eval_score)
+                quiet = self.pushSearchMove(board, move, opponent_mark)
+                eval_score = self.minimax(board, depth - 1, True, AI_mark, alpha, beta, ply + 1)
+                self.popSearchMove(board, opponent_mark, quiet)
+                if eval_score < minEval:
+                    minEval, best_move = eval_score, move
                 beta = min(beta, eval_score)
                 if beta <= alpha:
+                    self.recordCutoff(board, move, player_mark, depth, ply)
                     break
-            return minEval
+            best_score = minEval
+        if best_score <= alpha_orig:
+            flag = TranspositionTable.UPPER
+        elif best_score >= beta_orig:
+            flag = TranspositionTable.LOWER
+        else:
+            flag = TranspositionTable.EXACT
+        self.tt.store(key, depth, flag, best_score, best_move)
+        return best_score
 
-    def getBestMove(self, AI_mark: str) -> tuple[str, str] | None:
+    def searchRoot(self, board: BitBoard, moves: list[tuple[int, ...]], depth: int,
+                   AI_mark: str) -> tuple[float, tuple[int, ...] | None, dict]:
         """
-        Select the best move for AI using minimax with adaptive depth.
+        Search every root move to the given depth.
 
         Args:
+            board (BitBoard): Current position.
+            moves (list[tuple[int, ...]]): Root moves in the order they should be searched.
+            depth (int): Search depth in plies.
             AI_mark (str): The AI's piece ('B').
 
         Returns:
-            tuple[str, str] | None: The best move as (start_pos, end_pos), or None if no move.
+            tuple[float, tuple[int, ...] | None, dict]: Best score, best move and the score
+            found for each searched move (used to order the next iteration).
         """
-        depth = self.getAdaptiveDepth()
         best_score = float('-inf')
         best_move = None
         alpha = float('-inf')
         beta =  float('inf')
-        # Get all valid moves and sort them for initial evaluation
-        moves = self.availableValidMoves(AI_mark, self.grid)
-        # Prioritize capture moves first
-        moves.sort(key=lambda move: (self.validMove(AI_mark, move[0], move[1], [row.copy() for row in self.grid]) == 'capture',\
-            self.evaluateBoard(self.simulateMove(move, AI_mark, [row.copy() for row in self.grid]))),
-           reverse=True)
-
+        scores = {}
         for move in moves:
-            new_grid = self.simulateMove(move, AI_mark, self.grid)
-            if new_grid is None:
-                continue
-            eval_score = self.minimax(new_grid, depth - 1, False, AI_mark, alpha, beta)
+            quiet = self.pushSearchMove(board, move, AI_mark)
+            eval_score = self.minimax(board, depth - 1, False, AI_mark, alpha, beta, 1)
+            self.popSearchMove(board, AI_mark, quiet)
+            scores[move] = eval_score
             if eval_score > best_score:
                 best_score = eval_score
                 best_move = move
                 alpha = max(alpha, eval_score) # Update alpha in the main loop
-        return best_move
+        return best_score, best_move, scores
+
+    def searchRootParallel(self, board: BitBoard, moves: list[tuple[int, ...]], depth: int,
+                           AI_mark: str) -> tuple[float, tuple[int, ...] | None, dict]:
+        """
+        Search the root moves across a pool of worker processes (young brothers wait).
+
+        The first (expected best) move is searched alone to get a good alpha bound, then
+        the remaining moves are searched in parallel. Workers share alpha through a
+        multiprocessing value: each one starts from the best score found so far and
+        raises it when it finds a better move. Every worker gets the same absolute deadline,
+        so moves waiting in the pool queue do not get a fresh time budget.
+
+        Args:
+            board (BitBoard): Current position.
+            moves (list[tuple[int, ...]]): Root moves in the order they should be searched.
+            depth (int): Search depth in plies.
+            AI_mark (str): The AI's piece ('B').
+
+        Returns:
+            tuple[float, tuple[int, ...] | None, dict]: Same as searchRoot.
+        """
+        if self.pool is None:
+            self.shared_alpha = multiprocessing.Value('d', float('-inf'))
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=initSearchWorker,
+                                            initargs=(self.N, self.tt_size_mb / self.workers, self.shared_alpha,
+                                                      self.endgame_path))
+        self.shared_alpha.value = float('-inf')
+        # Wall-clock time is the same in every process, perf_counter need not be
+        deadline = None if self.deadline is None else time.time() + self.deadline - time.perf_counter()
+        position = (self.N, board.black, board.red, board.kings)
+        def submit(move):
+            return self.pool.submit(searchRootMove, position, move, depth, AI_mark, deadline,
+                                    self.search_path, self.search_quiet)
+        futures = [submit(moves[0])]
+        futures[0].result()  # The first move alone sets alpha for the others
+        futures += [submit(move) for move in moves[1:]]
+        best_score = float('-inf')
+        best_move = None
+        scores = {}
+        for future in futures:  # Same order as moves, so ties keep the first move
+            move, eval_score, nodes = future.result()
+            self.nodes += nodes
+            if eval_score is None:  # Out of time: drop the moves that have not started yet
+                for pending in futures:
+                    pending.cancel()
+                raise SearchTimeout
+            scores[move] = eval_score
+            if eval_score > best_score:
+                best_score = eval_score
+                best_move = move
+        return best_score, best_move, scores
+
+    def getBestMove(self, AI_mark: str, time_limit: float | None = None,
+                    depth: int | None = None) -> tuple[str, ...] | None:
+        """
+        Select the best move for AI using iterative deepening under a time budget.
+
+        Positions found in the opening book are played without searching. Otherwise the
+        search runs depth 1, 2, 3, ... on a BitBoard copy of the grid. Every iteration starts
+        with the previous best move and orders the rest by their previous scores. When the
+        time runs out the result of the last completed depth is returned. Without a time
+        limit a single search to getAdaptiveDepth depth is done. With more than one worker
+        the root moves of deeper iterations are searched in parallel.
+
+        Args:
+            AI_mark (str): The AI's piece ('B').
+            time_limit (float | None): Seconds for this move, defaults to self.time_limit.
+            depth (int | None): Search exactly this depth instead, ignoring the time limit.
+
+        Returns:
+            tuple[str, ...] | None: The best move as (start_pos, end_pos), with every landing
+            square of a multi-jump in between, or None if no move.
+        """
+        if time_limit is None:
+            time_limit = self.time_limit
+        fixed_depth = depth
+        self.nodes = 0
+        self.ageHeuristics()
+        self.search_path = {}
+        for key in self.position_history:  # Game positions count as repetitions in the search
+            self.search_path[key] = self.search_path.get(key, 0) + 1
+        self.search_quiet = self.quiet_plies
+        board = BitBoard.fromGrid(self.grid)
+        # Prioritize capture moves first, then the static evaluation of the child
+        moves = board.generateMoves(AI_mark)
+        if self.book is not None:
+            book_move = self.book.lookup(board, AI_mark)
+            if book_move in moves:
+                return tuple(board.squareName(sq) for sq in book_move)
+        moves.sort(key=lambda move: (board.isCapture(move), self.evaluateMove(board, move, AI_mark)), reverse=True)
+        if not moves:
+            return None
+        def search(depth):
+            if self.workers > 1 and depth >= 3:  # Shallow iterations are faster in one process
+                return self.searchRootParallel(board, moves, depth, AI_mark)
+            return self.searchRoot(board, moves, depth, AI_mark)
+        if len(moves) == 1:
+            best_move = moves[0]
+        elif fixed_depth is not None:
+            _, best_move, _ = search(fixed_depth)
+        elif time_limit is None:
+            _, best_move, _ = search(self.getAdaptiveDepth())
+        else:
+            start = time.perf_counter()
+            best_move = moves[0]
+            for depth in range(1, MAX_SEARCH_DEPTH + 1):
+                # Depth 1 always completes so there is a searched move to fall back on
+                self.deadline = start + time_limit if depth > 1 else None
+                try:
+                    best_score, best_move, scores = search(depth)
+                except SearchTimeout:
+                    break
+                finally:
+                    self.deadline = None
+                moves.sort(key=lambda move: (move == best_move, scores.get(move, float('-inf'))), reverse=True)
+                if abs(best_score) >= WIN_SCORE or time.perf_counter() - start >= time_limit:
+                    break  # Forced result found or no time left for a deeper iteration
+        return tuple(board.squareName(sq) for sq in best_move)
         
     def aiMove(self, AI_mark):
         """Execute the best move for AI"""
         move = self.getBestMove(AI_mark)
         self.clear_screen()
         if move:
-            start_pos, end_pos = move
-            self.validMove(AI_mark, start_pos, end_pos)
+            for start_pos, end_pos in zip(move, move[1:]):  # One jump at a time for multi-captures
+                self.makeMove(AI_mark, start_pos, end_pos)
             print(self)
-            print('-'*10 + f'AI moves {start_pos} -> {end_pos}' + '-'*10)    
+            print('-'*10 + f"AI moves {' -> '.join(move)}" + '-'*10)
+            end_pos = move[-1]
             r, c = int(end_pos[1:])-1, ord(end_pos[0])-ord('A')
             if self.grid[r][c].endswith('K'):
                 print("AI became King!")
         else:
             print(f"AI ({AI_mark}) has no valid moves.")
             
+## Parallel Search Workers
+worker_state: dict = {}
+
+def initSearchWorker(N: int, tt_size_mb: float, shared_alpha, endgame_path: str | None) -> None:
+    """Create the AI used by one worker process of the parallel root search."""
+    worker_state['ai'] = CheckersAI(N, tt_size_mb, time_limit=None, endgame_path=endgame_path, book_path=None)
+    worker_state['alpha'] = shared_alpha
+
+def searchRootMove(position: tuple[int, int, int, int], move: tuple[int, ...], depth: int,
+                   AI_mark: str, deadline: float | None,
+                   search_path: dict[int, int], search_quiet: int) -> tuple[tuple[int, ...], float | None, int]:
+    """
+    Search one root move inside a worker process.
+
+    Args:
+        position (tuple[int, int, int, int]): (N, black, red, kings) of the root position.
+        move (tuple[int, ...]): Root move to search.
+        depth (int): Search depth of the root in plies.
+        AI_mark (str): The AI's piece ('B').
+        deadline (float | None): time.time() at which the search must stop, None for no limit.
+        search_path (dict[int, int]): Game positions counted as repetitions by the search.
+        search_quiet (int): Plies without progress at the root.
+
+    Returns:
+        tuple[tuple[int, ...], float | None, int]: The move, its score (None if the time ran
+        out) and the number of nodes searched.
+    """
+    ai = worker_state['ai']
+    shared_alpha = worker_state['alpha']
+    time_left = None if deadline is None else deadline - time.time()
+    if time_left is not None and time_left <= 0:  # Waited in the queue past the deadline
+        return move, None, 0
+    board = BitBoard(*position)
+    ai.search_path = dict(search_path)
+    ai.search_quiet = search_quiet
+    ai.pushSearchMove(board, move, AI_mark)
+    ai.nodes = 0
+    ai.ageHeuristics()
+    ai.deadline = None if time_left is None else time.perf_counter() + time_left
+    # One below alpha: a move failing low returns less than the best score so far instead of
+    # tying with it, and a move as good as the best gets its exact score, so the merge picks
+    # the same move as the serial search
+    alpha = shared_alpha.value - 1
+    try:
+        eval_score = ai.minimax(board, depth - 1, False, AI_mark, alpha, float('inf'), 1)
+    except SearchTimeout:
+        return move, None, ai.nodes
+    finally:
+        ai.deadline = None
+    with shared_alpha.get_lock():
+        shared_alpha.value = max(shared_alpha.value, eval_score)
+    return move, eval_score, ai.nodes
+
 ## Main Program  
 if __name__=='__main__':
     N: int = 8
@@ -0,0 +1,95 @@
+## Connect Four Batch Analysis - best move and score for every game prefix in a file, as JSON lines
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from connect_four_core import WIN_SCORE, validMove, canWin, hasEmptySlot, analyzeMove, transposition_table
+
+def parseMoves(line):
+    'Split a game prefix into columns: 0-based, separated by spaces or commas, or a plain digit string like 3342'
+    line = line.strip()
+    if ',' in line or ' ' in line:
+        return [int(col) for col in line.replace(',', ' ').split()]
+    return [int(col) for col in line]
+
+def playMoves(moves, rows, cols, K):
+    'Play the moves on an empty grid, R first; returns (grid, mark to move) or raises ValueError'
+    grid = [['-' for _ in range(cols)] for _ in range(rows)]
+    mark = 'R'
+    for ply, col in enumerate(moves):
+        if not 0 <= col < cols:
+            raise ValueError(f'Column {col} out of range at ply {ply}')
+        if canWin(grid, 'R', K) or canWin(grid, 'Y', K):
+            raise ValueError(f'Game already won before ply {ply}')
+        if not validMove(grid, col, mark):
+            raise ValueError(f'Column {col} is full at ply {ply}')
+        mark = 'R' if mark == 'Y' else 'Y'
+    if canWin(grid, 'R', K) or canWin(grid, 'Y', K) or not hasEmptySlot(grid):
+        raise ValueError('Game is already over')
+    return grid, mark
+
+def analyzeLine(task):
+    'Analyze one input line in a worker process; returns its JSON record'
+    number, line, rows, cols, K, depth, time_limit = task
+    record = {'line': number, 'moves': line.strip()}
+    try:
+        grid, mark = playMoves(parseMoves(line), rows, cols, K)
+    except ValueError as error:
+        record['error'] = str(error)
+        return record
+    # Every position starts from an empty table, so results do not depend on which
+    # worker analyzed which positions before
+    transposition_table.clear()
+    start = time.perf_counter()
+    if depth is not None:
+        col, score, source = analyzeMove(grid, mark, 'minimax', depth=depth, K=K)
+    else:
+        col, score, source = analyzeMove(grid, mark, 'timed', time_limit=time_limit, K=K)
+    if score in (float('inf'), float('-inf')):  # Double threat, not valid JSON as is
+        score = WIN_SCORE if score > 0 else -WIN_SCORE
+    record.update({'to_move': mark, 'best': col, 'score': score, 'source': source,
+                   'seconds': round(time.perf_counter() - start, 6)})
+    return record
+
+def analyzeFile(lines, rows=6, cols=7, K=4, depth=None, time_limit=1.0, jobs=1):
+    'Yield the record of every non-empty line in input order, analyzing up to jobs positions at a time'
+    tasks = [(number, line, rows, cols, K, depth, time_limit)
+             for number, line in enumerate(lines, 1) if line.strip() and not line.lstrip().startswith('#')]
+    if jobs <= 1:
+        yield from map(analyzeLine, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(analyzeLine, tasks)
+
+def main(argv=None):
+    'Command line entry point'
+    parser = argparse.ArgumentParser(description='Analyze Connect Four game prefixes and stream JSON lines.')
+    parser.add_argument('input', help="file with one game prefix per line, e.g. '3342' or '3 3 4 2', R moving first; "
+                             "blank and # lines are skipped (- for stdin)")
+    parser.add_argument('--rows', type=int, default=6, help='board rows')
+    parser.add_argument('--cols', type=int, default=7, help='board columns')
+    parser.add_argument('--connect', type=int, default=4, help='discs in a row needed to win')
+    parser.add_argument('--depth', type=int, help='fixed search depth (overrides --time-limit)')
+    parser.add_argument('--time-limit', type=float, default=1.0, help='seconds per position')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='positions analyzed in parallel')
+    parser.add_argument('--output', help='write JSON lines here instead of standard output')
+    args = parser.parse_args(argv)
+    if args.input == '-':
+        lines = sys.stdin.readlines()
+    else:
+        with open(args.input) as file:
+            lines = file.readlines()
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for record in analyzeFile(lines, args.rows, args.cols, args.connect, args.depth, args.time_limit, args.jobs):
+            output.write(json.dumps(record) + '\n')
+            output.flush()
+    finally:
+        if args.output:
+            output.close()
+
+## Main Program
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,709 @@
+## Connect Four Core - board helpers, bitboard engine, search and solver shared by
+## connect_four_game.py and connect_four_updated.py
+import time
+import os
+import random
+import struct
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+def getColumn(grid, col_num):
+    'Return the values of a specific column as a list'
+    return list(map(lambda row: row[col_num], grid))
+
+def validMove(grid, c, mark):
+    'Try placing a mark in column c. Returns True if successful'
+    n = len(grid) - 1
+    col = getColumn(grid, c)
+    for r, data in enumerate(col[::-1]):  # search bottom-up
+        if data == '-':
+            grid[n-r][c] = mark
+            return True
+    return False  # column full
+
+def getEmptyPieces(grid):
+    'Returns total empty pieces available currently in grid'
+    empty_pieces = sum(row.count('-') for row in grid)
+    return empty_pieces
+
+def canWin(grid, mark, K=4):
+    'Check if player with mark has K in a row (K = 4 in standard Connect Four)'
+    rows = len(grid)
+    H = rows + 1
+    bits = 0
+    for r, row in enumerate(grid):
+        for c, cell in enumerate(row):
+            if cell == mark:
+                bits |= 1 << (c * H + rows - 1 - r)  # Same layout as BitBoard
+    return hasRun(bits, H, K)
+
+def hasEmptySlot(grid):
+    'Return True if there is at least one empty slot in the grid'
+    if any('-' in getColumn(grid, c) for c in range(len(grid[0]))):
+        return True
+    return False
+
+def allValidColumns(grid):
+    'Gets all valid columns(Prefering center one first) where move can be made'
+    total_cols = len(grid[0])
+    center = total_cols // 2
+    search_order = [center]
+    for offset in range(1, total_cols // 2 + 1):
+        if center - offset >= 0:
+            search_order.append(center - offset)
+        if center + offset < total_cols:
+            search_order.append(center + offset)   
+    cols = [col_num for col_num in search_order if '-' in getColumn(grid, col_num)]
+    return cols   
+                
+def evaluateBoard(grid, K=4):
+    'Evaluates the board and returns a score (for Y, the computer)'
+    return BitBoard.fromGrid(grid, K).evaluate('Y')
+
+def getAdaptiveDepth(grid):
+    'Returns adaptive depth based on empty pieces, one ply less on boards wider than 7 columns (more moves per ply)'
+    empty_pieces = getEmptyPieces(grid)
+    if empty_pieces >= 35:
+        depth = 8
+    elif empty_pieces >= 25:
+        depth = 9
+    elif empty_pieces >= 15:
+        depth = 10
+    else:
+        depth = 12
+    return depth - 1 if len(grid[0]) > 7 else depth
+
+## Bitboard Engine
+WIN_SCORE = 1000000  # Score of a won position
+window_cache = {}  # (rows, cols, K) -> winning windows and the windows through every cell
+
+def getWindows(rows, cols, K=4):
+    'Return all K-cell windows as bit indices, and the windows containing each bit (cached per configuration)'
+    if (rows, cols, K) not in window_cache:
+        H = rows + 1
+        windows = []
+        for dc, dr in [(0, 1), (1, 0), (1, 1), (1, -1)]:  # Vertical, horizontal, both diagonals
+            for c in range(cols):
+                for r in range(rows):
+                    cells = [(c + i * dc, r + i * dr) for i in range(K)]
+                    if all(0 <= cc < cols and 0 <= rr < rows for cc, rr in cells):
+                        windows.append(tuple(cc * H + rr for cc, rr in cells))
+        cell_windows = [[] for _ in range(cols * H)]
+        for index, window in enumerate(windows):
+            for bit_index in window:
+                cell_windows[bit_index].append(index)
+        window_cache[(rows, cols, K)] = (windows, cell_windows)
+    return window_cache[(rows, cols, K)]
+
+def hasRun(bits, H, K=4):
+    'Check K bits in a row in any direction; runs are doubled by shifting, so it takes about log2(K) shifts per direction'
+    for shift in (1, H, H - 1, H + 1):  # Vertical, horizontal and both diagonals
+        run, length = bits, 1  # Bits starting a run of length
+        while 2 * length <= K:
+            run &= run >> (length * shift)
+            length *= 2
+        if length < K:
+            run &= run >> ((K - length) * shift)
+        if run:
+            return True
+    return False
+
+def winningCells(bits, mask, H, full, K=4):
+    'Empty cells where the discs in bits would complete K in a row'
+    below = bits
+    for i in range(1, K - 1):
+        below &= bits << i
+    cells = below << 1  # Vertical: only on top of K - 1
+    for shift in (H, H - 1, H + 1):
+        # before[j] / after[j]: cells with j discs in a row right before / after them
+        before, after = [-1], [-1]
+        for j in range(1, K):
+            before.append(before[-1] & (bits << j * shift))
+            after.append(after[-1] & (bits >> j * shift))
+        for j in range(K):  # The cell is the (j+1)-th of the K
+            cells |= before[j] & after[K - 1 - j]
+    return cells & (full ^ mask)
+
+class BitBoard:
+    'Connect Four position as one bitboard per player, used by the search'
+    def __init__(self, rows, cols, K=4):
+        'Empty board for K in a row; each column uses rows + 1 bits, the top one always empty as a separator'
+        self.rows, self.cols, self.K = rows, cols, K
+        self.H = rows + 1
+        self.bits = {'R': 0, 'Y': 0}
+        self.mask = 0
+        self.heights = [col * self.H for col in range(cols)]  # Next free bit of every column
+        self.history = []
+        self.bottom = sum(1 << (col * self.H) for col in range(cols))
+        self.full = self.bottom * ((1 << rows) - 1)  # Every playable cell
+        self.column_masks = [((1 << rows) - 1) << (col * self.H) for col in range(cols)]
+        self.order = allValidColumns([['-'] * cols])  # Center-first column order
+        # Discs of each player in every window, and how many windows hold k discs of
+        # only that player (k = 0..K); updated on every drop instead of rescanning
+        self.windows, self.cell_windows = getWindows(rows, cols, K)
+        self.counts = {'R': [0] * len(self.windows), 'Y': [0] * len(self.windows)}
+        self.totals = {'R': [len(self.windows)] + [0] * K, 'Y': [len(self.windows)] + [0] * K}
+
+    @classmethod
+    def fromGrid(cls, grid, K=4):
+        'Build a bitboard from a grid of R, Y and -'
+        rows, cols = len(grid), len(grid[0])
+        board = cls(rows, cols, K)
+        for c in range(cols):
+            for r in range(rows - 1, -1, -1):  # Bottom-up, like dropping the discs
+                if grid[r][c] != '-':
+                    board.play(c, grid[r][c])
+        board.history.clear()
+        return board
+
+    def canPlay(self, col):
+        'Return True if column col is not full'
+        return self.heights[col] < col * self.H + self.rows
+
+    def validColumns(self):
+        'Columns that are not full, center first'
+        return [col for col in self.order if self.canPlay(col)]
+
+    def play(self, col, mark):
+        'Drop a disc of mark in column col'
+        bit_index = self.heights[col]
+        bit = 1 << bit_index
+        self.bits[mark] |= bit
+        self.mask |= bit
+        self.heights[col] += 1
+        self.history.append((col, mark))
+        opponent_mark = 'R' if mark == 'Y' else 'Y'
+        own_counts, opp_counts = self.counts[mark], self.counts[opponent_mark]
+        own_totals, opp_totals = self.totals[mark], self.totals[opponent_mark]
+        for window in self.cell_windows[bit_index]:
+            own, opp = own_counts[window], opp_counts[window]
+            if opp == 0:  # Still only mark's discs: one more of them
+                own_totals[own] -= 1
+                own_totals[own + 1] += 1
+            if own == 0:  # No longer usable by the opponent
+                opp_totals[opp] -= 1
+            own_counts[window] = own + 1
+
+    def undo(self):
+        'Take back the last disc played'
+        col, mark = self.history.pop()
+        self.heights[col] -= 1
+        bit_index = self.heights[col]
+        bit = 1 << bit_index
+        self.bits[mark] ^= bit
+        self.mask ^= bit
+        opponent_mark = 'R' if mark == 'Y' else 'Y'
+        own_counts, opp_counts = self.counts[mark], self.counts[opponent_mark]
+        own_totals, opp_totals = self.totals[mark], self.totals[opponent_mark]
+        for window in self.cell_windows[bit_index]:
+            own, opp = own_counts[window] - 1, opp_counts[window]
+            if opp == 0:
+                own_totals[own + 1] -= 1
+                own_totals[own] += 1
+            if own == 0:
+                opp_totals[opp] += 1
+            own_counts[window] = own
+
+    def isWin(self, mark):
+        'Check K in a row: vertical, horizontal and both diagonals'
+        return hasRun(self.bits[mark], self.H, self.K)
+
+    def key(self, mark):
+        'Unique number for the position with mark to move (discs of Y plus the mask identify the board)'
+        return (self.bits['Y'] + self.mask) * 2 + (mark == 'R')
+
+    def playableCells(self):
+        'The lowest empty cell of every column that is not full'
+        return (self.mask + self.bottom) & self.full
+
+    def threats(self, mark):
+        'Empty cells that would complete K in a row for mark'
+        return winningCells(self.bits[mark], self.mask, self.H, self.full, self.K)
+
+    def threatColumns(self, mark):
+        'Columns, center first, where mark wins by dropping a disc now'
+        playable_threats = self.threats(mark) & self.playableCells()
+        return [col for col in self.order if playable_threats & self.column_masks[col]]
+
+    def isFull(self):
+        'Return True if no disc can be dropped'
+        return self.mask == self.full
+
+    def evaluate(self, AI_mark):
+        'Evaluate the position for AI_mark from the window totals (K-1 and K-2 discs in a still open window)'
+        opponent_mark = 'R' if AI_mark == 'Y' else 'Y'
+        if self.isWin(AI_mark):
+            return WIN_SCORE
+        if self.isWin(opponent_mark):
+            return -WIN_SCORE
+        ai_totals, human_totals = self.totals[AI_mark], self.totals[opponent_mark]
+        score = 0
+        for n, weight in [(self.K - 1, 1000), (self.K - 2, 100)]:
+            score += ai_totals[n] * weight
+            score -= human_totals[n] * weight * 15
+        ## Count pieces in columns that are not full yet
+        open_columns = 0
+        for col in range(self.cols):
+            if self.canPlay(col):
+                open_columns |= self.column_masks[col]
+        score += (self.bits[AI_mark] & open_columns).bit_count() * 10
+        score -= (self.bits[opponent_mark] & open_columns).bit_count() * 10
+        return score
+
+def causesDoubleThreat(board, mark):
+    'Checks if mark has two or more winning drops on the board (from threat bitmasks)'
+    if board.isFull():
+        return None
+    winning_drops = board.threats(mark) & board.playableCells()
+    return winning_drops & (winning_drops - 1) != 0  # At least two bits set
+
+class SearchTimeout(Exception):
+    'Raised inside the search when the time budget of a move is used up'
+
+class TranspositionTable:
+    'Fixed-size table of search results indexed by position key, so transpositions are searched once'
+    EXACT, LOWER, UPPER = 0, 1, 2
+    def __init__(self, size=1 << 20):
+        'Allocate size slots; a slot holds (key, depth, flag, score, best column)'
+        self.size = size
+        self.entries = [None] * size
+
+    def probe(self, key):
+        'Return the entry stored for key, or None'
+        entry = self.entries[key % self.size]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key, depth, flag, score, best_col):
+        'Save a search result, keeping the deeper one when two positions share a slot'
+        index = key % self.size
+        entry = self.entries[index]
+        if entry is None or entry[0] == key or entry[1] <= depth:
+            self.entries[index] = (key, depth, flag, score, best_col)
+
+    def clear(self):
+        'Forget every stored result'
+        self.entries = [None] * self.size
+
+transposition_table = TranspositionTable()  # Kept across moves, positions of the last search are reused
+search_state = {'deadline': None, 'nodes': 0, 'config': None}
+
+def useConfiguration(board):
+    'Forget the stored search results when the board size or K changes, since position keys would clash'
+    config = (board.rows, board.cols, board.K)
+    if search_state['config'] != config:
+        transposition_table.clear()
+        solver_state['table'].clear()
+        search_state['config'] = config
+
+def negamax(board, depth, alpha, beta, mark, AI_mark):
+    'Negamax with alpha beta and a transposition table; returns the score for mark, the player to move'
+    search_state['nodes'] += 1
+    if search_state['deadline'] is not None and search_state['nodes'] & 1023 == 0 \
+            and time.perf_counter() > search_state['deadline']:
+        raise SearchTimeout
+    opponent_mark = 'R' if mark == 'Y' else 'Y'
+    if board.history and board.isWin(opponent_mark):  # Only the player who moved last can have won
+        return -(WIN_SCORE + depth)  # Prefer quicker wins
+    valid_cols = board.validColumns()
+    if depth == 0 or not valid_cols:
+        score = board.evaluate(AI_mark)
+        return score if mark == AI_mark else -score
+    # Threat bitmasks settle immediate wins and forced blocks without searching them
+    playable = board.playableCells()
+    if board.threats(mark) & playable:
+        return WIN_SCORE + depth - 1  # Wins with this move
+    if depth >= 2:
+        opponent_threats = board.threats(opponent_mark)
+        forced = opponent_threats & playable
+        if forced & (forced - 1):
+            return -(WIN_SCORE + depth - 2)  # Two threats cannot both be blocked
+        if forced:
+            valid_cols = [col for col in valid_cols if forced & board.column_masks[col]]
+        else:
+            # Dropping right below an opponent's threat hands over the win; skip unless nothing else is left
+            safe_cols = [col for col in valid_cols
+                         if not (playable & board.column_masks[col]) << 1 & opponent_threats]
+            valid_cols = safe_cols or valid_cols
+    # Leaf scores come from AI_mark's evaluation, so each AI side keeps its own entries
+    key = board.key(mark) * 2 + (AI_mark == 'R')
+    entry = transposition_table.probe(key)
+    if entry is not None:
+        _, entry_depth, flag, entry_score, hint = entry
+        if entry_depth >= depth:
+            if flag == TranspositionTable.EXACT:
+                return entry_score
+            if flag == TranspositionTable.LOWER:
+                alpha = max(alpha, entry_score)
+            else:
+                beta = min(beta, entry_score)
+            if alpha >= beta:
+                return entry_score
+        if hint in valid_cols:  # Best move of an earlier search is tried first
+            valid_cols.remove(hint)
+            valid_cols.insert(0, hint)
+    alpha_orig = alpha
+    best_score = float('-inf')
+    best_col = None
+    for col in valid_cols:
+        board.play(col, mark)
+        score = -negamax(board, depth-1, -beta, -alpha, opponent_mark, AI_mark)
+        board.undo()
+        if score > best_score:
+            best_score = score
+            best_col = col
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            break  # Cutoff
+    if best_score <= alpha_orig:
+        flag = TranspositionTable.UPPER
+    elif best_score >= beta:
+        flag = TranspositionTable.LOWER
+    else:
+        flag = TranspositionTable.EXACT
+    transposition_table.store(key, depth, flag, best_score, best_col)
+    return best_score
+
+def searchRoot(board, depth, AI_mark, valid_cols, fixed_scores):
+    'Score every root column to the given depth; returns (best score, best column, score per column)'
+    opponent_mark = 'R' if AI_mark == 'Y' else 'Y'
+    best_score = float('-inf')
+    best_col = valid_cols[0]  # Even if every move loses, a move must be played
+    alpha = float('-inf') ## Lower bound
+    scores = {}
+    for col in valid_cols:
+        if col in fixed_scores:
+            score = fixed_scores[col]
+        else:
+            board.play(col, AI_mark)
+            score = -negamax(board, depth-1, float('-inf'), -alpha, opponent_mark, AI_mark)
+            board.undo()
+        scores[col] = score
+        if score > best_score:
+            best_score = score
+            best_col = col
+        alpha = max(alpha, best_score)
+    return best_score, best_col, scores
+
+## Parallel Root Search
+worker_pool = {'pool': None, 'workers': 0, 'alpha': None}  # Reused across moves
+worker_state = {}
+
+def initSearchWorker(shared_alpha):
+    'Remember the shared alpha inside a worker process'
+    worker_state['alpha'] = shared_alpha
+
+def searchRootColumn(grid, col, depth, AI_mark, deadline, K=4):
+    'Search one root column in a worker until deadline (a time.time() value or None); returns (column, score or None if the time ran out, nodes)'
+    opponent_mark = 'R' if AI_mark == 'Y' else 'Y'
+    shared_alpha = worker_state['alpha']
+    time_left = None if deadline is None else deadline - time.time()
+    if time_left is not None and time_left <= 0:  # Waited in the queue past the deadline
+        return col, None, 0
+    board = BitBoard.fromGrid(grid, K)
+    useConfiguration(board)
+    board.play(col, AI_mark)
+    search_state['nodes'] = 0
+    search_state['deadline'] = None if time_left is None else time.perf_counter() + time_left
+    # One below alpha: a column as good as the best so far still gets its exact score,
+    # so ties are resolved by column order exactly like the serial search
+    alpha = shared_alpha.value - 1
+    try:
+        score = -negamax(board, depth-1, float('-inf'), -alpha, opponent_mark, AI_mark)
+    except SearchTimeout:
+        return col, None, search_state['nodes']
+    finally:
+        search_state['deadline'] = None
+    with shared_alpha.get_lock():
+        shared_alpha.value = max(shared_alpha.value, score)
+    return col, score, search_state['nodes']
+
+def closeWorkers():
+    'Shut down the worker processes of the parallel search, if any were started'
+    if worker_pool['pool'] is not None:
+        worker_pool['pool'].shutdown()
+        worker_pool['pool'] = None
+
+def searchRootParallel(board, grid, depth, AI_mark, valid_cols, fixed_scores, workers):
+    'Score the root columns across worker processes; returns the same as searchRoot'
+    if worker_pool['pool'] is None or worker_pool['workers'] != workers:
+        closeWorkers()
+        worker_pool['alpha'] = multiprocessing.Value('d', float('-inf'))
+        worker_pool['pool'] = ProcessPoolExecutor(max_workers=workers, initializer=initSearchWorker,
+                                                  initargs=(worker_pool['alpha'],))
+        worker_pool['workers'] = workers
+    pool, shared_alpha = worker_pool['pool'], worker_pool['alpha']
+    shared_alpha.value = max(fixed_scores.values(), default=float('-inf'))
+    # Every column gets the same wall-clock deadline (perf_counter is not shared between
+    # processes), so columns waiting in the pool queue do not get a fresh time budget
+    deadline = search_state['deadline']
+    if deadline is not None:
+        deadline += time.time() - time.perf_counter()
+    searched = [col for col in valid_cols if col not in fixed_scores]
+    futures = []
+    if searched:
+        # The first (expected best) column alone sets alpha, then the rest run in parallel
+        futures.append(pool.submit(searchRootColumn, grid, searched[0], depth, AI_mark, deadline, board.K))
+        futures[0].result()
+        futures += [pool.submit(searchRootColumn, grid, col, depth, AI_mark, deadline, board.K) for col in searched[1:]]
+    scores = dict(fixed_scores)
+    for future in futures:
+        col, score, nodes = future.result()
+        search_state['nodes'] += nodes
+        if score is None:  # Out of time: drop the columns that have not started yet
+            for pending in futures:
+                pending.cancel()
+            raise SearchTimeout
+        scores[col] = score
+    best_score = float('-inf')
+    best_col = valid_cols[0]  # Even if every move loses, a move must be played
+    for col in valid_cols:  # In column order, so ties keep the first column
+        if scores[col] > best_score:
+            best_score = scores[col]
+            best_col = col
+    return best_score, best_col, scores
+
+## Perfect-Play Solver
+SOLVER_EMPTY_CELLS = 18  # getBestMove solves the position exactly once this few cells are empty
+SOLVER_TIME_LIMIT = 1.0  # Seconds the minimax strategy gives the solver before searching instead
+solver_state = {'table': TranspositionTable(), 'nodes': 0, 'solutions': {}}
+
+def solverNegamax(current, mask, moves, alpha, beta, board):
+    'Exact negamax on (discs of the player to move, all discs); the player to move cannot win at once'
+    solver_state['nodes'] += 1
+    if search_state['deadline'] is not None and solver_state['nodes'] & 1023 == 0 \
+            and time.perf_counter() > search_state['deadline']:
+        raise SearchTimeout  # Bounds stored so far stay valid for the next attempt
+    H, K, full, size = board.H, board.K, board.full, board.rows * board.cols
+    possible = (mask + board.bottom) & full
+    opponent_wins = winningCells(current ^ mask, mask, H, full, K)
+    forced = possible & opponent_wins
+    if forced:
+        if forced & (forced - 1):  # Two threats to block: lost next move
+            return -((size - moves) // 2)
+        possible = forced
+    possible &= ~(opponent_wins >> 1)  # Never play right below an opponent's winning cell
+    if not possible:
+        return -((size - moves) // 2)
+    if moves >= size - 2:
+        return 0
+    # Score = cells left after the win; bound it by the earliest possible win and loss
+    low = -((size - 2 - moves) // 2)
+    if alpha < low:
+        alpha = low
+        if alpha >= beta:
+            return alpha
+    high = (size - 1 - moves) // 2
+    key = current + mask
+    entry = solver_state['table'].probe(key)
+    if entry is not None:
+        if entry[2] == TranspositionTable.UPPER:
+            high = min(high, entry[3])
+        else:
+            low = entry[3]
+            if alpha < low:
+                alpha = low
+                if alpha >= beta:
+                    return alpha
+    if beta > high:
+        beta = high
+        if alpha >= beta:
+            return beta
+    # Moves creating the most threats first, center first among equals
+    candidates = []
+    for col in board.order:
+        move = possible & board.column_masks[col]
+        if move:
+            candidates.append((winningCells(current | move, mask, H, full, K).bit_count(), move))
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+    for _, move in candidates:
+        score = -solverNegamax(current ^ mask, mask | move, moves + 1, -beta, -alpha, board)
+        if score >= beta:
+            solver_state['table'].store(key, 0, TranspositionTable.LOWER, score, None)
+            return score
+        alpha = max(alpha, score)
+    solver_state['table'].store(key, 0, TranspositionTable.UPPER, alpha, None)
+    return alpha
+
+def solutionPath(rows, cols, K=4):
+    'File caching solved positions of a board configuration, next to this script'
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), f'connect_four_{rows}x{cols}_{K}.solved')
+
+def solutionRecord(rows, cols):
+    'Record of a solved position: key (as many bytes as the board has bits), score'
+    return struct.Struct(f'<{(cols * (rows + 1) + 7) // 8}sb')
+
+def loadSolutions(rows, cols, K=4):
+    'Return the solved positions of a board configuration as {key: score}, read from disk on first use'
+    if (rows, cols, K) not in solver_state['solutions']:
+        solutions = {}
+        path = solutionPath(rows, cols, K)
+        if os.path.exists(path):
+            with open(path, 'rb') as file:
+                for key, score in solutionRecord(rows, cols).iter_unpack(file.read()):
+                    solutions[int.from_bytes(key, 'little')] = score
+        solver_state['solutions'][(rows, cols, K)] = solutions
+    return solver_state['solutions'][(rows, cols, K)]
+
+def solveBitBoard(board, mark, cached_only=False):
+    'Exact score for mark to move: positive wins (cells left after the win), 0 draws, negative loses'
+    solutions = loadSolutions(board.rows, board.cols, board.K)
+    current, mask = board.bits[mark], board.mask
+    key = current + mask
+    if key in solutions or cached_only:
+        return solutions.get(key)
+    useConfiguration(board)
+    moves = mask.bit_count()
+    size = board.rows * board.cols
+    if winningCells(current, mask, board.H, board.full, board.K) & (mask + board.bottom) & board.full:
+        score = (size + 1 - moves) // 2
+    else:
+        # Null-window searches narrow [low, high] down to the exact score
+        low, high = -((size - moves) // 2), (size + 1 - moves) // 2
+        while low < high:
+            med = low + (high - low) // 2
+            if med <= 0 and int(low / 2) < med:
+                med = int(low / 2)
+            elif med >= 0 and int(high / 2) > med:
+                med = int(high / 2)
+            result = solverNegamax(current, mask, moves, med, med + 1, board)
+            if result <= med:
+                high = result
+            else:
+                low = result
+        score = low
+    solutions[key] = score
+    record = solutionRecord(board.rows, board.cols)
+    with open(solutionPath(board.rows, board.cols, board.K), 'ab') as file:
+        file.write(record.pack(key.to_bytes(record.size - 1, 'little'), score))
+    return score
+
+def solvePosition(grid, mark, K=4):
+    'Game-theoretic score of the grid with mark to move (see solveBitBoard)'
+    return solveBitBoard(BitBoard.fromGrid(grid, K), mark)
+
+def getSolvedMove(grid, AI_mark, cached_only=False, K=4):
+    'Perfect move for AI_mark: returns (column, exact score), or (None, None) if the grid is full (or a child is not cached)'
+    opponent_mark = 'R' if AI_mark == 'Y' else 'Y'
+    board = BitBoard.fromGrid(grid, K)
+    best_col, best_score = None, None
+    for col in board.validColumns():
+        board.play(col, AI_mark)
+        if board.isWin(AI_mark):
+            score = (board.rows * board.cols + 2 - board.mask.bit_count()) // 2
+        elif board.isFull():
+            score = 0
+        else:
+            score = solveBitBoard(board, opponent_mark, cached_only)
+            if score is None:
+                board.undo()
+                return None, None
+            score = -score
+        board.undo()
+        if best_score is None or score > best_score:
+            best_col, best_score = col, score
+    return best_col, best_score
+
+## Move Selection
+STRATEGIES = ('rules', 'minimax', 'timed')
+
+def getRuleMove(board, AI_mark):
+    'Rule-based move: center first, the first column that does not let the opponent win next, else a random one'
+    opponent_mark = 'R' if AI_mark == 'Y' else 'Y'
+    valid_cols = board.validColumns()
+    for col in valid_cols:
+        board.play(col, AI_mark)
+        safe = not board.threats(opponent_mark) & board.playableCells()
+        board.undo()
+        if safe:
+            return col
+    return random.choice(valid_cols)
+
+def analyzeMove(grid, AI_mark, strategy=None, depth=None, time_limit=None, workers=1, K=4):
+    """
+    Gives AI Best Move for K in a row with one of the STRATEGIES:
+    rules   - win, block, then a center-first move that does not hand over a win
+    minimax - search to depth; without a depth, first try perfect play near the end for
+              SOLVER_TIME_LIMIT seconds, then search to the adaptive depth
+    timed   - deepen the search until time_limit seconds are used, near the end after
+              giving the solver half of them
+    Without a strategy, timed is used when a time limit is given and minimax otherwise.
+    workers > 1 searches root columns in parallel processes.
+    Returns (column, score, source), source telling what the score means: win (WIN_SCORE),
+    block or rules (None), solved (exact solver score) or search (search score, +-inf for
+    a double threat). All three are None if the grid is full.
+    """
+    if strategy is None:
+        strategy = 'minimax' if time_limit is None else 'timed'
+    if strategy not in STRATEGIES:
+        raise ValueError(f'Unknown strategy {strategy}, expected one of {STRATEGIES}')
+    if strategy == 'timed' and time_limit is None:
+        raise ValueError('The timed strategy needs a time_limit')
+    opponent_mark = 'R' if AI_mark == 'Y' else 'Y'
+    board = BitBoard.fromGrid(grid, K)
+    useConfiguration(board)
+    valid_cols = board.validColumns()
+    if not valid_cols: # safety check
+        return None, None, None
+    #Check for immediate winning moves for the AI
+    winning_cols = board.threatColumns(AI_mark)
+    if winning_cols:
+        return winning_cols[0], WIN_SCORE, 'win'
+    #Check for immediate blocking moves for the opponent
+    blocking_cols = board.threatColumns(opponent_mark)
+    if blocking_cols:
+        return blocking_cols[0], None, 'block'
+    if strategy == 'rules':
+        return getRuleMove(board, AI_mark), None, 'rules'
+    # Few cells left or every reply already solved: play perfectly (solutions are cached on disk),
+    # unless an explicit depth asks for a depth-limited search
+    start = time.perf_counter()
+    if strategy == 'timed' or depth is None:
+        if getEmptyPieces(grid) <= SOLVER_EMPTY_CELLS:
+            search_state['deadline'] = start + (time_limit / 2 if strategy == 'timed' else SOLVER_TIME_LIMIT)
+            try:
+                return getSolvedMove(grid, AI_mark, K=K) + ('solved',)
+            except SearchTimeout:
+                pass  # Not proven in time, the search below decides
+            finally:
+                search_state['deadline'] = None
+        solved_col, solved_score = getSolvedMove(grid, AI_mark, cached_only=True, K=K)
+        if solved_col is not None:
+            return solved_col, solved_score, 'solved'
+    ## Check for Double Threat    
+    fixed_scores = {}
+    for col in valid_cols:
+        board.play(col, AI_mark)
+        # Check if this AI move creates a double threat for human
+        if causesDoubleThreat(board, AI_mark):
+            fixed_scores[col] = float('inf')  # prefer moves creating double threats
+        # Check if this AI move allows opponent double threat in next turn
+        elif causesDoubleThreat(board, opponent_mark):
+            fixed_scores[col] = float('-inf')  # avoid moves that allow opponent double threats
+        board.undo()
+    search_state['nodes'] = 0
+    def search(depth):
+        if workers > 1 and depth >= 3:  # Shallow searches are faster in one process
+            return searchRootParallel(board, grid, depth, AI_mark, valid_cols, fixed_scores, workers)
+        return searchRoot(board, depth, AI_mark, valid_cols, fixed_scores)
+    if strategy == 'minimax':
+        best_score, best_col, _ = search(depth or getAdaptiveDepth(grid))
+        return best_col, best_score, 'search'
+    for depth in range(1, getEmptyPieces(grid) + 1):
+        # Depth 1 always completes so there is a searched move to fall back on
+        search_state['deadline'] = start + time_limit if depth > 1 else None
+        try:
+            best_score, best_col, scores = search(depth)
+        except SearchTimeout:
+            break
+        finally:
+            search_state['deadline'] = None
+        valid_cols.sort(key=lambda col: (col == best_col, scores[col]), reverse=True)
+        if abs(best_score) >= WIN_SCORE or time.perf_counter() - start >= time_limit:
+            break  # Forced result found or no time left for a deeper iteration
+    return best_col, best_score, 'search'
+
+def getBestMove(grid, AI_mark, strategy=None, depth=None, time_limit=None, workers=1, K=4):
+    'Gives AI Best Move, the column picked by analyzeMove (None if the grid is full)'
+    return analyzeMove(grid, AI_mark, strategy, depth, time_limit, workers, K)[0]
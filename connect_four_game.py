@@ -1,9 +1,12 @@
 ## Connect Four Game (Human vs Strong AI) — Coded & Documented By Husnain Maroof
 
-import random
 import time
 import os
 import platform
+from connect_four_core import validMove, canWin, hasEmptySlot, getBestMove
+
+# Choice -> (strategy, search depth, seconds per move) of the shared core AI
+AI_CHOICES = {'r': ('rules', None, None), 'm': ('minimax', 6, None), 't': ('timed', None, 2.0)}
 
 def colorize(cell):
     'Return the cell with color if its R, Y, or -'
@@ -48,123 +51,19 @@ def updateDisplay(grid):
     clearScreen()
     dispGrid(grid)
 
-def getColumn(grid, col_num):
-    'Return the values of a specific column as a list'
-    return [row[col_num] for row in grid]
-
-def isValidMove(grid, c, mark):
-    'Try placing a mark in column c. Return True if successful'
-    n = len(grid) - 1
-    col = getColumn(grid, c)
-    for r, data in enumerate(col[::-1]):  # search bottom-up
-        if data == '-':
-            grid[n-r][c] = mark
-            return True
-    return False  # column full
-
-def checkWin(grid, mark):
-    'Check if player with mark has a winning 4-in-a-row'
-    rows, cols = len(grid), len(grid[0])
-    # Vertical
-    for col in range(cols):
-        column = getColumn(grid, col)
-        for r in range(rows - 3):
-            if all(column[r+i] == mark for i in range(4)):
-                return True
-    # Horizontal
-    for row in grid:
-        for c in range(cols - 3):
-            if all(row[c+i] == mark for i in range(4)):
-                return True
-    # Diagonal \
-    for r in range(rows - 3):
-        for c in range(cols - 3):
-            if all(grid[r+i][c+i] == mark for i in range(4)):
-                return True
-    # Diagonal /
-    for r in range(3, rows):
-        for c in range(cols - 3):
-            if all(grid[r-i][c+i] == mark for i in range(4)):
-                return True
-    return False
-
-def hasEmptySlot(grid):
-    'Return True if there is at least one empty slot in the grid'
-    for c in range(len(grid[0])):
-        if '-' in getColumn(grid, c):
-            return True
-    return False
-
-# ---- Simulation helpers ----
-def simulateMoveOn(grid, col, mark):
-    'Simulate placing mark in column `col` on a copy of grid.Returns new grid, or None if the column is full'
-
-    new_grid = [row[:] for row in grid]
-    n = len(new_grid) - 1
-    col_data = getColumn(new_grid, col)
-    for r, data in enumerate(col_data[::-1]):  # bottom-up
-        if data == '-':
-            new_grid[n-r][col] = mark
-            return new_grid
-    return None  # column full
-
-# ---- Strong AI ----
-def getBestMove(grid, ai_mark, human_mark):
-    """
-    Decide the best move for the AI:
-    1. Win immediately if possible
-    2. Block human's immediate win
-    3. Prefer center, then outward
-    4. Avoid moves that give the human an immediate win
-    5. Fallback to random valid column
-    """
-    cols = len(grid[0])
-
-    # 1. Try immediate win
-    for col in range(cols):
-        new_grid = simulateMoveOn(grid, col, ai_mark)
-        if new_grid and checkWin(new_grid, ai_mark):
-            return col
-
-    # 2. Block human immediate win
-    for col in range(cols):
-        new_grid = simulateMoveOn(grid, col, human_mark)
-        if new_grid and checkWin(new_grid, human_mark):
-            return col
-
-    # 3. Search order: center first, then left/right alternates
-    center = cols // 2
-    search_order = [center]
-    for offset in range(1, cols // 2 + 1):
-        if center - offset >= 0:
-            search_order.append(center - offset)
-        if center + offset < cols:
-            search_order.append(center + offset)
-
-    # 4. Choose a safe move (does not allow human to win next turn)
-    for col in search_order:
-        new_grid = simulateMoveOn(grid, col, ai_mark)
-        if not new_grid:
-            continue
-        human_can_win = False
-        for opp_col in range(cols):
-            opp_grid = simulateMoveOn(new_grid, opp_col, human_mark)  # check after AI move
-            if opp_grid and checkWin(opp_grid, human_mark):
-                human_can_win = True
-                break
-        if not human_can_win:
-            return col
-
-    # 5. Fallback random valid column
-    valid_cols = [c for c in range(cols) if '-' in getColumn(grid, c)]
-    return random.choice(valid_cols)
-
 # ---- Game Loop ----
 def playGame(rows, cols):
     'Run the main Connect Four game loop'
     grid = [['-' for _ in range(cols)] for _ in range(rows)]
     players = [('Player', 'R'), ('Computer', 'Y')]
-    print('Computer(Y) is using strong AI.')
+    # Choose how the computer picks its moves
+    while True:
+        choice = input('Choose AI, R (rules), M (minimax depth 6) or T (2 seconds per move): ').strip().lower()
+        if choice in AI_CHOICES:
+            break
+        print('Enter R, M or T only!')
+    strategy, depth, time_limit = AI_CHOICES[choice]
+    print(f'Computer(Y) is using {strategy} AI.')
     dispGrid(grid)
 
     # Decide turn order
@@ -189,9 +88,9 @@ def playGame(rows, cols):
                     break
                 except ValueError:
                     print(f'Invalid input. Enter a number between 0 and {cols-1}.')
-            if isValidMove(grid, user_pick, mark):
+            if validMove(grid, user_pick, mark):
                 updateDisplay(grid)
-                if checkWin(grid, mark):
+                if canWin(grid, mark):
                     print(f'{current_player}({mark}) won!')
                     return
                 if not hasEmptySlot(grid):
@@ -202,12 +101,12 @@ def playGame(rows, cols):
                 continue
 
         else:  # AI turn
-            computer_pick = getBestMove(grid, 'Y', 'R')
-            isValidMove(grid, computer_pick, mark)
+            computer_pick = getBestMove(grid, 'Y', strategy, depth, time_limit)
+            validMove(grid, computer_pick, mark)
             print(f"{current_player}({mark}) chooses column {computer_pick}.")
             time.sleep(1)
             updateDisplay(grid)
-            if checkWin(grid, mark):
+            if canWin(grid, mark):
                 print(f'{current_player}({mark}) won!')
                 return
             if not hasEmptySlot(grid):
@@ -65,30 +65,13 @@ class Reversi:
         col = self.col_map[user_move[0]]
         if grid[row][col] != '-':
             return False
-
-        opponent_mark = 'W' if mark == 'B' else 'B'
-        directions = [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(-1,1),(1,-1),(1,1)] ## Piece can flip opponent piece in 8 directions
-        to_flip = []
-
-        for dr, dc in directions:
-            r, c = row + dr, col + dc
-            path = []
-            while 0 <= r < self.N and 0 <= c < self.N:
-                if grid[r][c] == opponent_mark:
-                    path.append((r,c))
-                elif grid[r][c] == mark:
-                    if path:
-                        to_flip.extend(path)
-                    break
-                else:
-                    break
-                r += dr
-                c += dc
-
+        board = BitBoard.fromGrid(grid)
+        to_flip = board.flips(1 << (row * self.N + col), mark) ## Pieces flipped in all 8 directions at once
         if to_flip: ## if at least one valid move found
             if not simulateMove:
                 grid[row][col] = mark
-                for r,c in to_flip:
+                for square in board.squares(to_flip):
+                    r, c = divmod(square, self.N)
                     grid[r][c] = mark
             return True
         return False
@@ -97,13 +80,8 @@ class Reversi:
         'Gives all available valid moves'
         if grid is None:
             grid = self.grid
-        valid_moves = []
-        for r in range(self.N):
-            for c in range(self.N):
-                user_move = self.letters[c] + str(r+1)
-                if self.isValidMove(user_move, mark, grid, simulateMove=True):
-                    valid_moves.append(user_move)
-        return valid_moves
+        board = BitBoard.fromGrid(grid)
+        return [board.moveName(square) for square in board.squares(board.validMoves(mark))]
 
     # ------------------ Game Status ------------------
     def isGameOver(self):
@@ -135,68 +113,14 @@ class Reversi:
             return f'Game is draw.\nBlack: {black}\tWhite: {white}'
         
     def isTerminal(self, grid): ## Will be used for evaluateBoard function
-        if '-' not in [cell for row in grid for cell in row]:
-            return True
-        if not self.availableValidMoves('B', grid) and not self.availableValidMoves('W', grid):
-            return True
-        return False    
+        return BitBoard.fromGrid(grid).isTerminal()
 
     # ------------------ AI: Minimax ------------------
     def evaluateBoard(self, grid=None):
-        'Board Evaluation Criteria'
+        'Board Evaluation Criteria (see BitBoard.evaluate)'
         if grid is None:
             grid = self.grid
-        ai_mark, human_mark = 'W', 'B'
-        score = 0
-        N = self.N
-    # 1. Piece Count: Simple score based on the number of pieces.
-        human_pieces, ai_pieces = self.countPieces(grid)
-        score += (ai_pieces - human_pieces) * 10
-    # 2. Mobility: Score based on the number of available moves.
-        ai_moves = len(self.availableValidMoves(ai_mark, grid))
-        human_moves = len(self.availableValidMoves(human_mark, grid))
-        score += (ai_moves - human_moves) * 50
-
-    # 3. Corner Control: Highly valuable.
-        corners = [(0, 0), (0, N - 1), (N - 1, 0), (N - 1, N - 1)]
-        for r, c in corners:
-            if grid[r][c] == ai_mark:
-                score += 200
-            elif grid[r][c] == human_mark:
-                score -= 200
-
-    # 4. Edge Control: Differentiate between safe and dangerous edges.
-        edge_squares = set()
-        dangerous_squares = set()
-        for i in range(1, N - 1):
-            # Top and bottom edges
-            edge_squares.add((0, i))
-            edge_squares.add((N - 1, i))
-            # Left and right edges
-            edge_squares.add((i, 0))
-            edge_squares.add((i, N - 1))
-    # Squares adjacent to corners, which are dangerous. Penalty for AI
-    # Dangerous squares are the ones that are adjacent to a corner,
-    # but are not corners themselves. Placing a piece on one of these squares can allow the opponent to capture a
-    # corner on their next move
-    
-        dangerous_squares.update([(0, 1), (1, 0), (1, 1),
-                                (0, N - 2), (1, N - 1), (1, N - 2),
-                                (N - 1, 1), (N - 2, 0), (N - 2, 1),
-                                (N - 1, N - 2), (N - 2, N - 1), (N - 2, N - 2)])
-        for r in range(N):
-            for c in range(N):
-                if (r, c) in dangerous_squares: ## if ai in dangerous squares, penalty is for ai
-                    if grid[r][c] == ai_mark:
-                        score -= 50
-                    elif grid[r][c] == human_mark: # if human in dangerous squares, reward is for human
-                        score += 50
-                elif (r, c) in edge_squares: 
-                    if grid[r][c] == ai_mark:
-                        score += 20
-                    elif grid[r][c] == human_mark:
-                        score -= 20
-        return score
+        return BitBoard.fromGrid(grid).evaluate()
         
     def getAdaptiveDepth(self):
         'Adjust depth dynamically based on remaining empty squares'
@@ -212,22 +136,24 @@ class Reversi:
         else:              # Late-midgame
             return 6  
 
-    def simulateMove(self, move, mark, grid):
-        'Simulates the specific move and updates grid'
-        new_grid = [row.copy() for row in grid]
-        self.isValidMove(move, mark, new_grid)
-        return new_grid
-
-    def minimax(self, grid, depth, maximizingPlayer, AI_mark, alpha, beta):
-        'Implements Minimax Algorithm for givrn Depth'
+    def minimax(self, board, depth, maximizingPlayer, AI_mark, alpha, beta):
+        'Implements Minimax Algorithm for given Depth on a BitBoard (moves are played and taken back in place)'
         opponent_mark = 'W' if AI_mark == 'B' else 'B'
-        if depth == 0 or self.isTerminal(grid):
-            return self.evaluateBoard(grid)
+        if depth == 0:
+            return board.evaluate()
+        mark = AI_mark if maximizingPlayer else opponent_mark
+        moves = board.validMoves(mark)
+        if not moves:
+            if not board.validMoves(opponent_mark if maximizingPlayer else AI_mark): ## Terminal: nobody can move
+                return board.evaluate()
+            ## No valid move: the turn passes to the other player
+            return self.minimax(board, depth-1, not maximizingPlayer, AI_mark, alpha, beta)
         if maximizingPlayer:
             maxEval = float('-inf')
-            for move in self.availableValidMoves(AI_mark, grid):
-                new_grid = self.simulateMove(move, AI_mark, grid)
-                eval = self.minimax(new_grid, depth-1, False, AI_mark, alpha, beta)
+            for square in board.squares(moves):
+                board.play(square, AI_mark)
+                eval = self.minimax(board, depth-1, False, AI_mark, alpha, beta)
+                board.undo()
                 maxEval = max(maxEval, eval)
                 alpha = max(alpha, eval)
                 if alpha>=beta:
@@ -235,9 +161,10 @@ class Reversi:
             return maxEval
         else:
             minEval = float('inf')
-            for move in self.availableValidMoves(opponent_mark, grid):
-                new_grid = self.simulateMove(move, opponent_mark, grid)
-                eval = self.minimax(new_grid, depth-1, True, AI_mark, alpha, beta)
+            for square in board.squares(moves):
+                board.play(square, opponent_mark)
+                eval = self.minimax(board, depth-1, True, AI_mark, alpha, beta)
+                board.undo()
                 minEval = min(minEval, eval)
                 beta = min(beta, eval)
                 if beta <= alpha:
@@ -253,13 +180,14 @@ class Reversi:
         best_move = None
         alpha = float('-inf') ## Lower bound
         beta = float('inf') ## Higher bound
-        
-        for move in self.availableValidMoves(AI_mark, self.grid):
-            new_grid = self.simulateMove(move, AI_mark, self.grid)
-            score = self.minimax(new_grid, depth-1, False, AI_mark, alpha, beta)
+        board = BitBoard.fromGrid(self.grid)
+        for square in board.squares(board.validMoves(AI_mark)):
+            board.play(square, AI_mark)
+            score = self.minimax(board, depth-1, False, AI_mark, alpha, beta)
+            board.undo()
             if score > best_score:
                 best_score = score
-                best_move = move
+                best_move = board.moveName(square)
             alpha = max(alpha, best_score)    
         return best_move
 
@@ -316,6 +244,163 @@ class Reversi:
             self.updateDisplay()
            
 
+# ------------------ Bitboard Engine ------------------
+class BitBoard:
+    'Reversi position as one integer per player, bit r*N + c for row r and column c (64 bits on 8x8)'
+    letters = Reversi.letters
+    mask_cache = {}  # N -> shifts and edge masks
+    def __init__(self, N, black=0, white=0):
+        'Position with the given bitmasks of black and white pieces'
+        self.N = N
+        self.bits = {'B': black, 'W': white}
+        self.masks = BitBoard.getMasks(N)
+        self.history = []  # (mark, move, flipped) of every played move, for undo
+
+    @classmethod
+    def fromGrid(cls, grid):
+        'Build a bitboard from a grid of B, W and -'
+        N = len(grid)
+        black = white = 0
+        for r in range(N):
+            for c in range(N):
+                if grid[r][c] == 'B':
+                    black |= 1 << (r * N + c)
+                elif grid[r][c] == 'W':
+                    white |= 1 << (r * N + c)
+        return cls(N, black, white)
+
+    @classmethod
+    def getMasks(cls, N):
+        'Build (once per board size) the shift and edge mask of every direction, and the evaluation masks'
+        if N in cls.mask_cache:
+            return cls.mask_cache[N]
+        def squaresWhere(condition):
+            bits = 0
+            for r in range(N):
+                for c in range(N):
+                    if condition(r, c):
+                        bits |= 1 << (r * N + c)
+            return bits
+        # Kogge-Stone fill steps (1, 2, 4, ...) covering the longest line of opponent pieces (N - 2)
+        steps, covered = [], 0
+        while covered < N - 2:
+            steps.append(1 << len(steps))
+            covered += steps[-1]
+        # A direction (dr, dc) shifts by dr*N + dc bits, up for a positive amount and down for a
+        # negative one; its mask keeps the squares that have a neighbour on the board in the
+        # opposite direction, so shifted bits never wrap around an edge
+        directions = []
+        for dr, dc in [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(-1,1),(1,-1),(1,1)]:
+            amount = dr * N + dc
+            edge = squaresWhere(lambda r, c: 0 <= r - dr < N and 0 <= c - dc < N)
+            directions.append((amount > 0, [abs(amount) * step for step in steps], abs(amount), edge))
+        corners = [(0, 0), (0, N - 1), (N - 1, 0), (N - 1, N - 1)]
+        # Squares next to a corner are dangerous: a piece there can let the opponent take the corner
+        dangerous = [(0, 1), (1, 0), (1, 1), (0, N - 2), (1, N - 1), (1, N - 2),
+                     (N - 1, 1), (N - 2, 0), (N - 2, 1), (N - 1, N - 2), (N - 2, N - 1), (N - 2, N - 2)]
+        edge = squaresWhere(lambda r, c: (r in (0, N - 1) and 0 < c < N - 1) or (c in (0, N - 1) and 0 < r < N - 1))
+        masks = {
+            'full': (1 << (N * N)) - 1,
+            'directions': directions,
+            'corners': squaresWhere(lambda r, c: (r, c) in corners),
+            'dangerous': squaresWhere(lambda r, c: (r, c) in dangerous),
+        }
+        masks['edges'] = edge & ~masks['dangerous']  # Dangerous squares on an edge only count as dangerous
+        cls.mask_cache[N] = masks
+        return masks
+
+    def validMoves(self, mark):
+        'Bitmask of empty squares where mark flips at least one piece, every direction filled with Kogge-Stone steps'
+        own = self.bits[mark]
+        opp = self.bits['W' if mark == 'B' else 'B']
+        empty = self.masks['full'] & ~(own | opp)
+        moves = 0
+        for up, shifts, amount, edge in self.masks['directions']:
+            # Fill own pieces over opponent ones, doubling the reach every step; the opponent
+            # pieces reached lie in a line behind an own piece, the square after them is a move
+            gen, pro = own, opp & edge
+            if up:
+                for shift in shifts:
+                    gen |= pro & (gen << shift)
+                    pro &= pro << shift
+                moves |= (gen & opp) << amount & edge & empty
+            else:
+                for shift in shifts:
+                    gen |= pro & (gen >> shift)
+                    pro &= pro >> shift
+                moves |= (gen & opp) >> amount & edge & empty
+        return moves
+
+    def flips(self, move, mark):
+        'Bitmask of the opponent pieces flipped by playing the square bit move (0 if the move is not valid)'
+        own = self.bits[mark]
+        opp = self.bits['W' if mark == 'B' else 'B']
+        flipped = 0
+        for up, shifts, amount, edge in self.masks['directions']:
+            # The same fill from the move: flipped if the line of opponent pieces ends on an own piece
+            gen, pro = move, opp & edge
+            if up:
+                for shift in shifts:
+                    gen |= pro & (gen << shift)
+                    pro &= pro << shift
+                if gen << amount & edge & own:
+                    flipped |= gen & opp
+            else:
+                for shift in shifts:
+                    gen |= pro & (gen >> shift)
+                    pro &= pro >> shift
+                if gen >> amount & edge & own:
+                    flipped |= gen & opp
+        return flipped
+
+    def play(self, square, mark):
+        'Place a piece of mark on square and flip the captured pieces'
+        move = 1 << square
+        flipped = self.flips(move, mark)
+        opponent_mark = 'W' if mark == 'B' else 'B'
+        self.bits[mark] |= move | flipped
+        self.bits[opponent_mark] ^= flipped
+        self.history.append((mark, move, flipped))
+
+    def undo(self):
+        'Take back the last move played'
+        mark, move, flipped = self.history.pop()
+        opponent_mark = 'W' if mark == 'B' else 'B'
+        self.bits[mark] ^= move | flipped
+        self.bits[opponent_mark] |= flipped
+
+    @staticmethod
+    def squares(bits):
+        'Square numbers of the set bits, lowest first (row by row, like the grid)'
+        squares = []
+        while bits:
+            low = bits & -bits
+            squares.append(low.bit_length() - 1)
+            bits ^= low
+        return squares
+
+    def moveName(self, square):
+        'Name of a square in the form D3 (column letter, row number)'
+        r, c = divmod(square, self.N)
+        return self.letters[c] + str(r + 1)
+
+    def isTerminal(self):
+        'Game is over when the board is full or neither player has a valid move'
+        if self.bits['B'] | self.bits['W'] == self.masks['full']:
+            return True
+        return not self.validMoves('B') and not self.validMoves('W')
+
+    def evaluate(self):
+        'Score for the computer (W): piece count, mobility, corners, dangerous squares next to corners and edges'
+        ai, human = self.bits['W'], self.bits['B']
+        masks = self.masks
+        score = (ai.bit_count() - human.bit_count()) * 10
+        score += (self.validMoves('W').bit_count() - self.validMoves('B').bit_count()) * 50
+        score += ((ai & masks['corners']).bit_count() - (human & masks['corners']).bit_count()) * 200
+        score -= ((ai & masks['dangerous']).bit_count() - (human & masks['dangerous']).bit_count()) * 50
+        score += ((ai & masks['edges']).bit_count() - (human & masks['edges']).bit_count()) * 20
+        return score
+
 # ------------------ Run Game ------------------
 if __name__ == '__main__':
     N = 8